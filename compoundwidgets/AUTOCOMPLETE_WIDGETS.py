@@ -1,11 +1,905 @@
 import tkinter as tk
 import ttkbootstrap as ttk
+from abc import ABC, abstractmethod
+import bisect
+import functools
+import heapq
+import queue
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .SCRIPTS import *
 from .COMPOUND_WIDGETS import LabelCompoundWidget
 
+NBSP = '\u00a0'
 
-class AutocompleteEntryList(ttk.Frame):
+# Rows shown instead of values while searching, when nothing matches or when the search fails (never selectable)
+NO_MATCH = '(no match)'
+SEARCHING = '(searching…)'
+SEARCH_ERROR = '(search error)'
+PLACEHOLDERS = (NO_MATCH, SEARCHING, SEARCH_ERROR)
+
+
+def normalize_text(value, case_sensitive=False):
+    """ Normalization applied to the values and to the queries: upper case (unless case sensitive), NBSP folded """
+    if case_sensitive:
+        return str(value).replace(NBSP, ' ')
+    return str(value).upper().replace(NBSP, ' ')
+
+
+class SearchIndex:
+    """
+    Trigram search index used by the autocomplete widgets.
+    Created for a list of values and queried every time the entry changes. Nothing is computed on creation: the
+    values are normalized on the first search, and the trigram index is built on a worker thread after the first
+    non-empty query. Until it is ready, searches scan all the values.
+    Values and queries are normalized (upper-cased unless case sensitive, NBSP folded into regular spaces) and an
+    item matches when the normalized query is a substring of the normalized item.
+    Parameters:
+        values: values to be indexed
+        case_sensitive: whether char case shall be respected
+        cache_size: number of query results kept in memory
+    Methods for the user:
+        search(query, is_cancelled=None): returns the (sorted) indexes of the values that match the query
+        prefix_search(query): returns the (sorted) indexes of the values that start with the query
+        char_candidates(query): returns the (sorted) indexes of the values holding the rarest char of the query
+        normalize(query): returns the query normalized as the indexed values
+        build(): builds the trigram index right away (if not built yet)
+        clear_cache(): discards all cached query results
+    """
+
+    # Number of keys checked between two cancellation checks
+    chunk_size = 4096
+
+    _executor = None
+
+    def __init__(self, values, case_sensitive=False, cache_size=64):
+
+        self.case_sensitive = case_sensitive
+        self.values = values
+        self._keys = None
+        self._build_lock = threading.Lock()
+
+        # Each trigram points to the (ascending) indexes of the keys that contain it (None until built)
+        self.grams = None
+        self._grams_future = None
+
+        # Results of the latest queries, oldest first. Searches may run on a worker thread.
+        self.cache_size = cache_size
+        self._cache = {}
+        self._lock = threading.Lock()
+
+        # Keys in alphabetical order, only built if a prefix search is made
+        self._sorted_keys = None
+
+        # Each char points to the (ascending) indexes of the keys that contain it, only built if a fuzzy search is made
+        self._chars = None
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def keys(self):
+        """ Normalized values, computed on first use """
+        if self._keys is None:
+            with self._build_lock:
+                if self._keys is None:
+                    self._keys = [self.normalize(item) for item in self.values]
+        return self._keys
+
+    @classmethod
+    def _get_executor(cls):
+        """ A single worker builds the trigram indexes, one at a time """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search_index')
+        return cls._executor
+
+    def build(self):
+        """ Builds the trigram index (if not built yet) """
+
+        keys = self.keys
+        with self._build_lock:
+            if self.grams is not None:
+                return
+            grams = {}
+            for i, key in enumerate(keys):
+                for gram in {key[j:j + 3] for j in range(len(key) - 2)}:
+                    grams.setdefault(gram, []).append(i)
+            self.grams = grams
+
+    def normalize(self, query):
+        """ Normalization applied to both the values and the queries """
+        return normalize_text(query, self.case_sensitive)
+
+    def _candidates(self, query):
+        """ Indexes of the keys that may contain the query (None when all keys must be checked) """
+
+        grams = self.grams
+        if grams is None or len(query) < 3:
+            return None
+
+        postings = []
+        for gram in {query[j:j + 3] for j in range(len(query) - 2)}:
+            posting = grams.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # Only the keys holding the rarest trigram may contain the whole query
+        return min(postings, key=len)
+
+    def _scan(self, query, candidates, is_cancelled=None):
+        """ Verifies which candidates contain the query. Returns None if the search is cancelled. """
+
+        keys = self.keys
+        if candidates is None:
+            candidates = range(len(keys))
+
+        step = self.chunk_size if is_cancelled else len(candidates)
+        result = []
+        for start in range(0, len(candidates), max(step, 1)):
+            if is_cancelled and is_cancelled():
+                return None
+            result.extend([i for i in candidates[start:start + step] if query in keys[i]])
+        return result
+
+    def search(self, query, is_cancelled=None):
+        """
+        Returns the sorted indexes of the values that match the query.
+        When a previous query is contained in the new one (the user typed one more character), only the previous
+        hits are filtered. Repeated queries (the user pressed backspace) are answered from the cache.
+        'is_cancelled' is an optional callable, checked while searching: if it returns True the search stops
+        and None is returned.
+        """
+
+        query = self.normalize(query)
+
+        # The trigram index is only built for lists that are actually searched, away from the Tk thread
+        if query and self.grams is None and self._grams_future is None:
+            self._grams_future = self._get_executor().submit(self.build)
+
+        with self._lock:
+            cached = self._cache.get(query)
+            if cached is not None:
+                return cached
+
+            # Every match of the new query is also a match of any query it contains
+            base = None
+            for previous, hits in self._cache.items():
+                if previous in query and (base is None or len(previous) > len(base[0])):
+                    base = (previous, hits)
+
+        if base:
+            candidates = base[1]
+        else:
+            candidates = self._candidates(query)
+
+        result = self._scan(query, candidates, is_cancelled)
+        if result is None:
+            return None
+
+        if query:
+            with self._lock:
+                self._cache[query] = result
+                if len(self._cache) > self.cache_size:
+                    del self._cache[next(iter(self._cache))]
+
+        return result
+
+    def prefix_search(self, query):
+        """ Returns the sorted indexes of the values that start with the query (binary search on sorted keys) """
+
+        query = self.normalize(query)
+        with self._lock:
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted((key, i) for i, key in enumerate(self.keys))
+        sorted_keys = self._sorted_keys
+
+        result = []
+        for position in range(bisect.bisect_left(sorted_keys, (query,)), len(sorted_keys)):
+            key, i = sorted_keys[position]
+            if not key.startswith(query):
+                break
+            result.append(i)
+        result.sort()
+        return result
+
+    def char_candidates(self, query):
+        """
+        Returns the sorted indexes of the values that contain the rarest char of the (normalized) query.
+        Any value holding all the chars of the query is among them.
+        """
+
+        with self._lock:
+            if self._chars is None:
+                self._chars = {}
+                for i, key in enumerate(self.keys):
+                    for char in set(key):
+                        self._chars.setdefault(char, []).append(i)
+        chars = self._chars
+
+        postings = []
+        for char in set(query):
+            posting = chars.get(char)
+            if not posting:
+                return []
+            postings.append(posting)
+        if not postings:
+            return range(len(self.keys))
+        return min(postings, key=len)
+
+    def clear_cache(self):
+        """ Discards all cached query results """
+        with self._lock:
+            self._cache.clear()
+
+
+class Catalogue(tuple):
+    """
+    Immutable list of values to be shared by several autocomplete widgets.
+    It may be used anywhere a list of values is accepted (list_values, values, combo_list, set_list, ...).
+    The normalized values and the search index are built once, on first use, and reused by every widget
+    holding the catalogue, instead of once per widget.
+    Parameters:
+        values: values of the catalogue
+    Methods for the user:
+        get_index(case_sensitive): returns the shared search index of the catalogue
+    """
+
+    def __new__(cls, values=()):
+        return super().__new__(cls, values)
+
+    def __init__(self, values=()):
+        super().__init__()
+        self._indexes = {}
+        self._members = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, value):
+        """ Membership test through a set, as widgets check their value against the list on every get/set """
+        if self._members is None:
+            self._members = frozenset(self)
+        try:
+            return value in self._members
+        except TypeError:
+            return super().__contains__(value)
+
+    def get_index(self, case_sensitive=False):
+        """ Returns the search index, building it on first use """
+        with self._lock:
+            index = self._indexes.get(case_sensitive)
+            if index is None:
+                index = SearchIndex(self, case_sensitive)
+                self._indexes[case_sensitive] = index
+        return index
+
+
+class SearchCancelled(Exception):
+    """ Raised internally when a search is cancelled while the results are being ranked """
+
+
+class Matcher(ABC):
+    """
+    Base matcher for the autocomplete widgets.
+    A matcher decides which values match the query and, when ranking, orders them from the best to the worst match.
+    Ranking uses a bounded heap: only the best 'top_k' results are kept and the other matches are never sorted.
+    Parameters:
+        top_k: maximum number of ranked results. If not given, all matches are returned in their original order.
+    Methods for the user:
+        match(index, query, is_cancelled=None): indexes of the values that match the query
+    Methods for subclasses:
+        normalize(index, query): normalizes the query as the indexed values (None if nothing can match)
+        prepare(query): converts the normalized query to the form used by 'score'
+        candidates(index, query, is_cancelled): indexes that may match the query (None if cancelled)
+        score(key, prepared_query): score of a normalized value (lower is better), None if it does not match
+    """
+
+    default_top_k = None
+
+    def __init__(self, top_k=None):
+        self.top_k = top_k if top_k is not None else self.default_top_k
+
+    def normalize(self, index, query):
+        return index.normalize(query)
+
+    def prepare(self, query):
+        return query
+
+    def candidates(self, index, query, is_cancelled=None):
+        return range(len(index))
+
+    @abstractmethod
+    def score(self, key, prepared_query):
+        pass
+
+    def match(self, index, query, is_cancelled=None):
+        """ Indexes of the values that match the query, best first when ranking. None if cancelled. """
+
+        query = self.normalize(index, query)
+        if query is None:
+            return []
+        candidates = self.candidates(index, query, is_cancelled)
+        if candidates is None:
+            return None
+
+        keys = index.keys
+        prepared_query = self.prepare(query)
+        score = self.score
+
+        def scored():
+            step = index.chunk_size
+            for start in range(0, len(candidates), step):
+                if is_cancelled and is_cancelled():
+                    raise SearchCancelled
+                for i in candidates[start:start + step]:
+                    value = score(keys[i], prepared_query)
+                    if value is not None:
+                        yield value, i
+
+        try:
+            if self.top_k:
+                return [i for value, i in heapq.nsmallest(self.top_k, scored())]
+            return [i for value, i in scored()]
+        except SearchCancelled:
+            return None
+
+
+class SubstringMatcher(Matcher):
+    """ Values containing the query. Ranked by the position of the query, then by the length of the value. """
+
+    def candidates(self, index, query, is_cancelled=None):
+        return index.search(query, is_cancelled)
+
+    def score(self, key, prepared_query):
+        position = key.find(prepared_query)
+        if position < 0:
+            return None
+        return position, len(key)
+
+    def match(self, index, query, is_cancelled=None):
+        if not self.top_k:
+            return index.search(query, is_cancelled)
+        return super().match(index, query, is_cancelled)
+
+
+class PrefixMatcher(Matcher):
+    """ Values starting with the query. Ranked by the length of the value. """
+
+    def candidates(self, index, query, is_cancelled=None):
+        return index.prefix_search(query)
+
+    def score(self, key, prepared_query):
+        if not key.startswith(prepared_query):
+            return None
+        return len(key)
+
+
+class TokenMatcher(Matcher):
+    """
+    Values containing every word of the query, in any order.
+    Ranked by the positions of the words, then by the length of the value.
+    """
+
+    def prepare(self, query):
+        return tuple(set(query.split()))
+
+    def candidates(self, index, query, is_cancelled=None):
+
+        hits = None
+        for token in sorted(self.prepare(query), key=len, reverse=True):
+            found = index.search(token, is_cancelled)
+            if found is None:
+                return None
+            if hits is None:
+                hits = found
+            else:
+                found = set(found)
+                hits = [i for i in hits if i in found]
+            if not hits:
+                break
+
+        if hits is None:
+            return range(len(index))
+        return hits
+
+    def score(self, key, prepared_query):
+        total = 0
+        for token in prepared_query:
+            position = key.find(token)
+            if position < 0:
+                return None
+            total += position
+        return total, len(key)
+
+
+class FuzzyMatcher(Matcher):
+    """
+    Values containing the characters of the query in the same order, but not necessarily together.
+    Always ranked: exact substrings first, then by the number of extra characters between the first and last
+    matched characters, then by the position of the first match and by the length of the value.
+    """
+
+    default_top_k = 100
+
+    def candidates(self, index, query, is_cancelled=None):
+        return index.char_candidates(query)
+
+    def score(self, key, prepared_query):
+
+        position = key.find(prepared_query)
+        if position >= 0:
+            return 0, position, len(key)
+
+        first = position = key.find(prepared_query[0])
+        if position < 0:
+            return None
+        for char in prepared_query[1:]:
+            position = key.find(char, position + 1)
+            if position < 0:
+                return None
+        return position - first + 1 - len(prepared_query), first, len(key)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_pattern(pattern, case_sensitive=False):
+    """ Compiles (once per pattern) a user regular expression. Returns None if the pattern is not valid. """
+
+    # The search is not anchored, so leading and trailing '.*' only add backtracking
+    while pattern.startswith('.*') and pattern[2:3] not in ('*', '+', '?', '{'):
+        pattern = pattern[2:]
+    while pattern.endswith('.*') and not pattern.endswith('\\.*'):
+        pattern = pattern[:-2]
+
+    try:
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return None
+
+
+class RegexMatcher(Matcher):
+    """
+    Values matching a regular expression. Must be chosen explicitly, as the other matchers take the query as text.
+    Invalid (or incomplete) patterns match nothing. Ranked by the position of the first match.
+    """
+
+    def normalize(self, index, query):
+        return compile_pattern(str(query).replace(NBSP, ' '), index.case_sensitive)
+
+    def score(self, key, prepared_query):
+        found = prepared_query.search(key)
+        if found is None:
+            return None
+        return found.start(), len(key)
+
+
+# Dictionary that correlates the match mode to the appropriate matcher class
+matcher_dict = {
+    'substring': SubstringMatcher,
+    'prefix': PrefixMatcher,
+    'tokens': TokenMatcher,
+    'fuzzy': FuzzyMatcher,
+    'regex': RegexMatcher,
+}
+
+
+def get_matcher(match_mode='substring', top_k=None):
+    """ Returns the matcher for the given match mode (a Matcher instance is returned as it is) """
+    if isinstance(match_mode, Matcher):
+        return match_mode
+    matcher_class = matcher_dict.get(str(match_mode).lower(), None)
+    if not matcher_class:
+        raise Exception('Match mode not found in current matchers dictionary.')
+    return matcher_class(top_k)
+
+
+def get_search_index(values, case_sensitive=False):
+    """ Search index for a list of values: shared if the values are a Catalogue, else a new one """
+    if isinstance(values, Catalogue):
+        return values.get_index(case_sensitive)
+    return SearchIndex(values, case_sensitive)
+
+
+class ValueProvider(ABC):
+    """
+    Source of values for the autocomplete widgets.
+    Widgets ask the provider for pages of matches for the current query, so the values do not need to be loaded
+    in memory when the widget is created. Subclasses must implement 'search'.
+    Only the list provider supports the match modes and ranking (match_mode / top_k) of the widgets, the other
+    providers match substrings.
+    Methods for the user:
+        search(query, offset=0, limit=None, is_cancelled=None): page of values matching the query
+        first_page(limit=None): values shown when the entry is empty
+        value in provider: whether the value is one of the provider values (among its first 'contains_limit'
+            matches, unless the provider has an exact lookup)
+    """
+
+    # Page size used by the widgets when none is given (None: all the matches at once)
+    default_page_size = 100
+
+    # Maximum number of matches checked for an exact match on membership tests
+    contains_limit = 1000
+
+    @abstractmethod
+    def search(self, query, offset=0, limit=None, is_cancelled=None):
+        pass
+
+    def first_page(self, limit=None):
+        return self.search('', 0, limit)
+
+    def __contains__(self, value):
+        return value in self.search(value, 0, self.contains_limit)
+
+
+class ListProvider(ValueProvider):
+    """
+    In memory provider (default), for lists, tuples and Catalogues.
+    Parameters:
+        values: list of values (not copied: it shall not be changed while in use, call 'set_list' instead)
+        case_sensitive: whether char case shall be respected
+        matcher: Matcher used for the search (substring if not given)
+    """
+
+    default_page_size = None
+
+    def __init__(self, values, case_sensitive=False, matcher=None):
+        self.values = values
+        self.index = get_search_index(values, case_sensitive)
+        self.matcher = matcher if matcher else SubstringMatcher()
+
+    def search(self, query, offset=0, limit=None, is_cancelled=None):
+        index = self.matcher.match(self.index, query, is_cancelled)
+        if index is None:
+            return None
+        values = self.values
+        end = offset + limit if limit else None
+        return [values[i] for i in index[offset:end]]
+
+    def first_page(self, limit=None):
+        if limit:
+            return self.values[:limit]
+        return self.values
+
+    def __contains__(self, value):
+        return value in self.values
+
+
+class CallableProvider(ValueProvider):
+    """
+    Provider for a user function that returns a page of matches.
+    Parameters:
+        function: function(query, offset, limit) returning a list of values
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def search(self, query, offset=0, limit=None, is_cancelled=None):
+        return list(self.function(query, offset, limit))
+
+
+class IteratorProvider(ValueProvider):
+    """
+    Provider for an iterator (a generator over a file, for instance).
+    Values are only read from the iterator when a page cannot be filled with the values already read.
+    Every value read is kept in memory, since an iterator cannot be read twice: a query with few (or no) matches
+    reads the whole iterator. Use 'max_values' to bound the memory, and a SQLiteProvider (or a function) for
+    catalogues that do not fit in memory.
+    Parameters:
+        iterable: iterable or iterator with the values
+        case_sensitive: whether char case shall be respected
+        max_values: maximum number of values read from the iterator (None for all), the remaining ones are ignored
+    """
+
+    # Maximum number of values read from the iterator on a membership test
+    contains_read_limit = 10000
+
+    def __init__(self, iterable, case_sensitive=False, max_values=None):
+        self.iterator = iter(iterable)
+        self.case_sensitive = case_sensitive
+        self.max_values = max_values
+        self.values = []
+        self.keys = []
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def _read_next(self):
+        """ Reads one more value from the iterator. Returns False when there are no more values. """
+        if self.exhausted:
+            return False
+        if self.max_values is not None and len(self.values) >= self.max_values:
+            self.exhausted = True
+            return False
+        try:
+            value = next(self.iterator)
+        except StopIteration:
+            self.exhausted = True
+            return False
+        self.values.append(value)
+        self.keys.append(normalize_text(value, self.case_sensitive))
+        return True
+
+    def search(self, query, offset=0, limit=None, is_cancelled=None):
+
+        query = normalize_text(query, self.case_sensitive)
+        result = []
+        skipped = 0
+        position = 0
+        with self._lock:
+            while limit is None or len(result) < limit:
+                if position == len(self.keys) and not self._read_next():
+                    break
+                if is_cancelled and not position % 4096 and is_cancelled():
+                    return None
+                if query in self.keys[position]:
+                    if skipped < offset:
+                        skipped += 1
+                    else:
+                        result.append(self.values[position])
+                position += 1
+        return result
+
+    def __contains__(self, value):
+        """ Exact lookup on the values already read, then on (at most 'contains_read_limit') new values """
+        with self._lock:
+            if value in self.values:
+                return True
+            for _ in range(self.contains_read_limit):
+                if not self._read_next():
+                    break
+                if self.values[-1] == value:
+                    return True
+        return False
+
+
+class SQLiteProvider(ValueProvider):
+    """
+    Provider for a column of a table in a local SQLite database file.
+    Matches are found by the database (substring match), a page at a time, in the table (rowid) order.
+    Rows with a NULL value are ignored (also on the first page, so that further pages continue from it).
+    Parameters:
+        database: path to the SQLite file
+        table: table name
+        column: column with the values
+        case_sensitive: whether char case shall be respected (otherwise, as SQLite LIKE: ASCII only)
+    """
+
+    def __init__(self, database, table, column, case_sensitive=False):
+        for name in (table, column):
+            if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', str(name)):
+                raise Exception(f'Invalid SQLite identifier: {name}')
+        self.database = database
+        self.table = table
+        self.column = column
+        self.case_sensitive = case_sensitive
+        self._local = threading.local()
+
+    def _connection(self):
+        """ SQLite connections cannot be shared between threads: one per thread """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.database)
+            self._local.connection = connection
+        return connection
+
+    def search(self, query, offset=0, limit=None, is_cancelled=None):
+
+        value = f"replace({self.column}, char(160), ' ')"
+        query = str(query).replace(NBSP, ' ')
+        if self.case_sensitive:
+            condition = f'instr({value}, ?) > 0'
+            parameter = query
+        else:
+            condition = f"{value} LIKE ? ESCAPE '\\'"
+            parameter = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+        sql = f'SELECT {self.column} FROM {self.table} WHERE {condition} ORDER BY rowid LIMIT ? OFFSET ?'
+        connection = self._connection()
+        if is_cancelled:
+            connection.set_progress_handler(lambda: 1 if is_cancelled() else 0, 1000)
+        try:
+            rows = connection.execute(sql, (parameter, -1 if limit is None else limit, offset)).fetchall()
+        except sqlite3.OperationalError:
+            if is_cancelled and is_cancelled():
+                return None
+            raise
+        finally:
+            if is_cancelled:
+                connection.set_progress_handler(None, 0)
+        return [row[0] for row in rows]
+
+    def __contains__(self, value):
+        sql = f'SELECT 1 FROM {self.table} WHERE {self.column} = ? LIMIT 1'
+        return self._connection().execute(sql, (value,)).fetchone() is not None
+
+
+def get_provider(values, case_sensitive=False, matcher=None):
+    """
+    Value provider for the values given to a widget: a provider, a function, a list or an iterator.
+    Match modes other than 'substring' and ranking (top_k) are only available for lists.
+    """
+    if hasattr(values, '__getitem__') and hasattr(values, '__len__') and not isinstance(values, ValueProvider):
+        return ListProvider(values, case_sensitive, matcher)
+
+    if matcher is not None and (type(matcher) is not SubstringMatcher or matcher.top_k):
+        raise Exception('Match modes and top_k are only available for lists of values, not for value providers.')
+    if isinstance(values, ValueProvider):
+        return values
+    if callable(values):
+        return CallableProvider(values)
+    return IteratorProvider(values, case_sensitive)
+
+
+class BackgroundSearch:
+    """
+    Runs the autocomplete searches on a worker thread, keeping the Tk mainloop responsive.
+    Only the latest query matters: submitting a new one cancels the previous search and discards its results.
+    Results are handed back to the Tk thread through a queue, which is polled with 'after'.
+    If the search raises an exception, it is handed back as well: 'error_method' is called (if given) and the
+    exception is reported as any other Tk callback exception.
+    Parameters:
+        widget: widget used to schedule the polling of the results
+        result_method: method called on the Tk thread with (query, result) for the latest query
+        poll_ms: time (ms) between checks for finished searches
+        error_method: method called on the Tk thread with (query, exception) when the latest search fails
+    Methods for the user:
+        submit(search_method, query): runs search_method(query, is_cancelled) on the worker thread
+        cancel(): cancels the current search, its results will not be delivered
+    """
+
+    _executor = None
+
+    def __init__(self, widget, result_method, poll_ms=20, error_method=None):
+
+        self.widget = widget
+        self.result_method = result_method
+        self.error_method = error_method
+        self.poll_ms = poll_ms
+        self._generation = 0
+        self._future = None
+        self._poll_job = None
+        self._results = queue.Queue()
+
+    @classmethod
+    def _get_executor(cls):
+        """ A single worker is shared by all widgets, so cancelled searches never pile up """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='autocomplete')
+        return cls._executor
+
+    def submit(self, search_method, query):
+        """ Starts a search on the worker thread, cancelling the previous one """
+
+        self.cancel()
+        generation = self._generation
+
+        def is_cancelled():
+            return generation != self._generation
+
+        def run():
+            try:
+                result = search_method(query, is_cancelled)
+            except Exception as error:
+                if not is_cancelled():
+                    self._results.put((generation, query, error, True))
+                return
+            if result is not None and not is_cancelled():
+                self._results.put((generation, query, result, False))
+
+        self._future = self._get_executor().submit(run)
+        if self._poll_job is None:
+            self._poll_job = self.widget.after(self.poll_ms, self._poll)
+
+    def cancel(self):
+        """ Cancels the current search """
+        self._generation += 1
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    def stop(self):
+        """ Cancels the current search and stops polling (to be called when the widget is destroyed) """
+        self.cancel()
+        if self._poll_job is not None:
+            self.widget.after_cancel(self._poll_job)
+            self._poll_job = None
+
+    def _poll(self):
+        """ Delivers finished results (or errors) on the Tk thread """
+
+        self._poll_job = None
+
+        # A search that finished without a result (or whose result is read below) needs no more polling
+        future = self._future
+        finished = future is not None and future.done()
+
+        while True:
+            try:
+                generation, query, result, failed = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                continue
+            self._future = None
+            if failed:
+                if self.error_method:
+                    self.error_method(query, result)
+                self.widget._root().report_callback_exception(type(result), result, result.__traceback__)
+            else:
+                self.result_method(query, result)
+
+        if finished and self._future is future:
+            self._future = None
+        if self._future is not None:
+            self._poll_job = self.widget.after(self.poll_ms, self._poll)
+
+
+class AutocompleteSearch:
+    """
+    Mixin with the filtering shared by the autocomplete widgets: filtering after the user stops typing (debounce),
+    searching on a worker thread and cancelling both when the widget is destroyed.
+    Widgets call '_init_search' on their initialization and implement '_filter', '_search_finished' and
+    '_search_failed'.
+    """
+
+    def _init_search(self, filter_delay_ms=0, threaded_search=False):
+        self.filter_delay_ms = filter_delay_ms
+        self._filter_job = None
+        self.threaded_search = threaded_search
+        self.background_search = BackgroundSearch(self, self._search_finished, error_method=self._search_failed)
+
+    def _schedule_filter(self):
+        """ Filters right away or, if a delay is set, only after the user stops typing """
+
+        if not self.filter_delay_ms:
+            self._filter()
+            return
+
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(self.filter_delay_ms, self._filter)
+
+    def _cancel_filter(self):
+        """ Cancels the filtering of the latest change: the scheduled job and the search on the worker thread """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        self.background_search.cancel()
+
+    def _placeholder_selected(self, event=None):
+        """ Combobox selection of a placeholder row: restores the typed text and stops the selection event """
+        if self.variable.get() not in PLACEHOLDERS:
+            return None
+        self.variable.set(self._query)
+        self.combobox.icursor(tk.END)
+        return 'break'
+
+    def _page_size(self):
+        """ Number of values fetched at a time from the provider (None for all) """
+        if self.page_size:
+            return self.page_size
+        return self.provider.default_page_size
+
+    def _search_task(self, offset=0):
+        """
+        Search to be run on the worker thread: bound to the current provider and page size, so replacing the values
+        while it runs does not affect it.
+        """
+        provider = self.provider
+        page_size = self._page_size()
+
+        def search(query, is_cancelled):
+            return provider.search(query, offset, page_size, is_cancelled)
+        return search
+
+    def destroy(self):
+        """ Cancels any pending filtering before destroying the widget """
+        self._cancel_filter()
+        self.background_search.stop()
+        super().destroy()
+
+
+class AutocompleteEntryList(AutocompleteSearch, ttk.Frame):
     """
     Autocomplete compound widget which combines an Entry Widget and a Listbox Widget
     Filling the entry widget filters the content from the listbox widget.
@@ -20,8 +914,18 @@ class AutocompleteEntryList(ttk.Frame):
         entry_max_char: maximum number of characters for the entry
         list_method: method to be called when an item is selected
         list_height: number of lines on the listbox
-        list_values: values to be shown on the listbox
+        list_values: values to be shown on the listbox: a list, an iterator, a function(query, offset, limit)
+            returning a page of matches or a ValueProvider (SQLiteProvider, for instance)
         case_sensitive: whether char case shall be respected
+        filter_delay_ms: time (ms) without changes before the listbox is filtered (0 filters on every change)
+        threaded_search: whether the search runs on a worker thread (recommended for very large lists)
+        max_results: maximum number of values shown on the listbox, the remaining ones are summarized in a last row
+        match_mode: 'substring', 'prefix', 'tokens' (all words, any order), 'fuzzy', 'regex' or a Matcher instance
+        top_k: if given, matches are ranked and only the best 'top_k' are shown
+            (match_mode and top_k are only available for lists of values, other providers match substrings)
+        virtual_list: whether only the visible rows are sent to the listbox (recommended for very large lists)
+        page_size: number of values fetched at a time, further pages are fetched with the '(load more…)' row
+            (default: all the values for lists, 100 values for the other providers)
     Methods for the user:
         set_list(new_list): sets a new list of values to the listbox widget
         set_entry(value): sets a value to the entry widget
@@ -31,19 +935,37 @@ class AutocompleteEntryList(ttk.Frame):
         enable(): turns the whole widget 'on'
     """
 
+    # Rows sent to a virtual listbox beyond the visible ones
+    virtual_overscan = 10
+
+    # Last row of the listbox when there may be more matches to fetch from the provider
+    load_more_text = '(load more…)'
+
     def __init__(self, parent, label_text='label:', label_anchor='w', label_width=None,
                  entry_value='', entry_numeric=False, entry_width=None, entry_max_char=None,
                  entry_change_method=None, list_method=None, list_height=5, case_sensitive=False,
-                 list_values=('Value 1', 'Value 2', 'Value 3', 'Value 4'), style=None):
+                 list_values=('Value 1', 'Value 2', 'Value 3', 'Value 4'), style=None, filter_delay_ms=0,
+                 threaded_search=False, max_results=None, match_mode='substring', top_k=None,
+                 virtual_list=False, page_size=None):
 
         # Parent class initialization
         super().__init__(parent, padding=5)
 
         # Entry validation for numbers
-        validate_numbers = self.register(float_only)
-        validate_chars = self.register(max_chars)
+        validate_numbers = register_validator(self, get_validator('float', entry_max_char))
+        validate_chars = register_validator(self, get_validator('max_chars', entry_max_char))
 
         self.case_sensitive = case_sensitive
+        self._init_search(filter_delay_ms, threaded_search)
+        self.max_results = max_results
+        self._footer = None
+        self.matcher = get_matcher(match_mode, top_k)
+        self.virtual_list = virtual_list
+        self._rows = ()
+        self._top = 0
+        self.page_size = page_size
+        self._loaded = []
+        self._search_offset = 0
 
         # Style definition
         self.label_style_list = (
@@ -85,11 +1007,11 @@ class AutocompleteEntryList(ttk.Frame):
 
             # Restrict numeric values
             if entry_numeric:
-                self.entry.config(validate='all', validatecommand=(validate_numbers, '%d', '%P', '%S', entry_max_char))
+                self.entry.config(validate='key', validatecommand=(validate_numbers, '%d', '%P', '%S'))
 
             # Restrict max characters
             elif entry_max_char:
-                self.entry.config(validate='all', validatecommand=(validate_chars, '%d', '%P', entry_max_char))
+                self.entry.config(validate='key', validatecommand=(validate_chars, '%d', '%P'))
 
         # List box and scroll bar
         if True:
@@ -106,13 +1028,25 @@ class AutocompleteEntryList(ttk.Frame):
 
             # List box
             self.full_list = list_values
-            self.caps_full_list = [item.upper() for item in list_values]
-            self.list_var = tk.StringVar(value=self.full_list)
-            self.lb = tk.Listbox(self.container, listvariable=self.list_var, height=list_height,
-                                 yscrollcommand=self.vscroll.set)
+            self.provider = get_provider(list_values, case_sensitive, self.matcher)
+            self.list_var = tk.StringVar()
+            self.lb = tk.Listbox(self.container, listvariable=self.list_var, height=list_height)
             self.lb.grid(row=0, column=0, sticky='nsew')
 
-            self.vscroll['command'] = self.lb.yview
+            # Virtual list: the scroll bar moves a window over the rows instead of scrolling the listbox
+            if self.virtual_list:
+                self.vscroll['command'] = self._virtual_yview
+                self.lb.bind('<Configure>', lambda event: self._render_rows())
+                self.lb.bind('<MouseWheel>', self._virtual_mouse_wheel)
+                self.lb.bind('<Button-4>', self._virtual_mouse_wheel)
+                self.lb.bind('<Button-5>', self._virtual_mouse_wheel)
+                self.lb.bind('<Up>', self._virtual_key)
+                self.lb.bind('<Down>', self._virtual_key)
+            else:
+                self.lb.configure(yscrollcommand=self.vscroll.set)
+                self.vscroll['command'] = self.lb.yview
+
+            self._show_first_page()
 
         # Binds and initialization
         if True:
@@ -144,18 +1078,164 @@ class AutocompleteEntryList(ttk.Frame):
             if self.entry_change_method:
                 self.entry.event_generate("<Return>")
 
-        if self.entry_var.get() == '':
-            self.list_var.set(self.full_list)
+        self._schedule_filter()
+
+    def _filter(self):
+        """ Filters the full list with the current entry value and updates the listbox """
+
+        self._filter_job = None
+        self._search_offset = 0
+        query = self.entry_var.get()
+        if query == '':
+            self.background_search.cancel()
+            self._show_first_page()
+
+        elif self.threaded_search:
+            self._set_listbox((SEARCHING,))
+            self.background_search.submit(self._search_task(), query)
 
         else:
-            words = self._comparison()
-            if words:
-                self.lb.delete(0, tk.END)
-                for w in words:
-                    self.lb.insert(tk.END, w)
-            else:
-                self.lb.delete(0, tk.END)
-                self.lb.insert(tk.END, '(no match)')
+            self._show_words(self._comparison(query))
+
+    def _search_finished(self, query, words):
+        """ Receives the results from the worker thread: a new search or the next page of the current one """
+        offset, self._search_offset = self._search_offset, 0
+        if offset:
+            self._append_words(words)
+        else:
+            self._show_words(words)
+
+    def _search_failed(self, query, error):
+        """ Receives the error of a failed search from the worker thread """
+        self._search_offset = 0
+        self._loaded = []
+        self._set_listbox((SEARCH_ERROR,))
+
+    def _show_words(self, words):
+        """ Updates the listbox with the filtered values """
+        self._loaded = list(words) if words else []
+        if words:
+            self._set_listbox(words, more=self._page_is_full(words))
+        else:
+            self._set_listbox((NO_MATCH,))
+
+    def _show_first_page(self):
+        """ Updates the listbox with the values shown when the entry is empty """
+        values = self.provider.first_page(self._page_size())
+        self._loaded = values
+        self._set_listbox(values, more=self._page_is_full(values))
+
+    def _page_is_full(self, values):
+        """ Whether the last page fetched was full, so there may be more values to fetch """
+        page_size = self._page_size()
+        return bool(page_size) and len(values) > 0 and len(values) % page_size == 0
+
+    def _load_more(self):
+        """ Fetches the next page of matches from the provider (on the worker thread, if threaded) """
+
+        query = self.entry_var.get()
+        offset = len(self._loaded)
+        if self.threaded_search:
+            self._search_offset = offset
+            self.background_search.submit(self._search_task(offset), query)
+        else:
+            self._append_words(self.provider.search(query, offset, self._page_size()))
+
+    def _append_words(self, words):
+        """ Appends the next page of matches to the listbox """
+
+        if not words:
+            self._set_listbox(self._loaded)
+            return
+
+        top = self._top
+        self._loaded = list(self._loaded) + list(words)
+        self._set_listbox(self._loaded, more=self._page_is_full(self._loaded))
+        if self.virtual_list:
+            self._top = top
+            self._render_rows()
+
+    def _set_listbox(self, values, more=False):
+        """
+        Replaces the listbox content in a single update (through its list variable).
+        If there are more values than 'max_results', only those are shown, followed by a '(N more…)' row.
+        If 'more' is set, the values are followed by a '(load more…)' row, which fetches the next page.
+        """
+
+        if self.max_results and len(values) > self.max_results:
+            self._footer = f'({len(values) - self.max_results} more…)'
+            values = tuple(values[:self.max_results]) + (self._footer,)
+        elif more:
+            self._footer = self.load_more_text
+            values = tuple(values) + (self._footer,)
+        else:
+            self._footer = None
+
+        self._rows = values
+        self._top = 0
+        if self.virtual_list:
+            self._render_rows()
+        else:
+            self.list_var.set(tuple(values))
+
+    # Virtual list methods ---------------------------------------------------------------------------------------------
+    def _visible_rows(self):
+        """ Number of rows the listbox is able to show """
+        rows = int(self.lb.cget('height'))
+        if self.lb.winfo_height() > 1 and self.lb.size():
+            rows = max(rows, self.lb.nearest(self.lb.winfo_height()) + 1)
+        return rows
+
+    def _render_rows(self):
+        """ Sends to the listbox only the visible rows (plus a few extra rows) and updates the scroll bar """
+
+        total = len(self._rows)
+        visible = self._visible_rows()
+        self._top = max(0, min(self._top, total - visible))
+        self.list_var.set(tuple(self._rows[self._top:self._top + visible + self.virtual_overscan]))
+        self.lb.yview(0)
+        if total:
+            self.vscroll.set(self._top / total, min(1.0, (self._top + visible) / total))
+        else:
+            self.vscroll.set(0.0, 1.0)
+
+    def _virtual_yview(self, *args):
+        """ Scroll bar command for the virtual list """
+
+        if args[0] == 'moveto':
+            self._top = int(float(args[1]) * len(self._rows))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self._visible_rows()
+            self._top += amount
+        self._render_rows()
+
+    def _virtual_mouse_wheel(self, event):
+        if event.num == 4:
+            self._virtual_yview('scroll', -1, 'units')
+        elif event.num == 5:
+            self._virtual_yview('scroll', 1, 'units')
+        else:
+            self._virtual_yview('scroll', int(-1 * event.delta / 120), 'units')
+        return 'break'
+
+    def _virtual_key(self, event):
+        """ Moves the window when the keyboard selection reaches the first or last visible row """
+
+        index = self.lb.index(tk.ACTIVE)
+        if event.keysym == 'Down' and index >= self._visible_rows() - 1:
+            step = 1
+        elif event.keysym == 'Up' and index == 0 and self._top > 0:
+            step = -1
+        else:
+            return None
+
+        self._virtual_yview('scroll', step, 'units')
+        self.lb.selection_clear(0, tk.END)
+        self.lb.activate(index)
+        self.lb.selection_set(index)
+        return 'break'
 
     def call_entry_method(self, event=None):
         """ Calls the entry change method """
@@ -165,7 +1245,12 @@ class AutocompleteEntryList(ttk.Frame):
     def _listbox_selection(self, event):
         """ Responds to a selection event on the listbox """
 
-        if self.lb.get(tk.ACTIVE) == '(no match)':
+        if self.lb.get(tk.ACTIVE) in PLACEHOLDERS:
+            return
+
+        if self._footer and self._top + self.lb.index(tk.ACTIVE) == len(self._rows) - 1:
+            if self._footer == self.load_more_text and str(self.lb.cget('state')) != 'disabled':
+                self._load_more()
             return
 
         if not self.lb.get(tk.ACTIVE):
@@ -174,39 +1259,29 @@ class AutocompleteEntryList(ttk.Frame):
         if str(self.lb.cget('state')) == 'disabled':
             return
 
+        # The list stays empty after a selection: the filtering for the selected value is not needed
         self.entry_var.set(self.lb.get(tk.ACTIVE))
-        self.list_var.set('')
+        self._cancel_filter()
+        self._set_listbox(())
         if self.list_method:
             self.list_method(event)
 
-    def _comparison(self):
-        """ Responsible for the pattern match from the entry value """
-
-        if not self.case_sensitive:
-            pattern_1 = re.compile('.*' + self.entry_var.get().upper() + '.*')
-            pattern_2 = re.compile('.*' + self.entry_var.get().upper().replace(' ', '\u00a0') + '.*')
-            index = []
-            for i, name in enumerate(self.caps_full_list):
-                if re.match(pattern_1, name) or re.match(pattern_2, name):
-                    index.append(i)
-        else:
-            pattern_1 = re.compile('.*' + self.entry_var.get() + '.*')
-            pattern_2 = re.compile('.*' + self.entry_var.get().replace(' ', '\u00a0') + '.*')
-            index = []
-            for i, name in enumerate(self.full_list):
-                if re.match(pattern_1, name) or re.match(pattern_2, name):
-                    index.append(i)
+    def _comparison(self, query=None, is_cancelled=None):
+        """
+        Responsible for the pattern match from the entry value.
+        """
 
-        result = [w for i, w in enumerate(self.full_list) if i in index]
-
-        return result
+        if query is None:
+            query = self.entry_var.get()
+        return self.provider.search(query, 0, self._page_size(), is_cancelled)
 
     def set_list(self, new_list):
-        """ Sets a new list for the listbox """
+        """ Sets a new list (or provider) for the listbox """
         self.entry_var.set('')
+        self._cancel_filter()
         self.full_list = new_list
-        self.caps_full_list = [item.upper() for item in new_list]
-        self.list_var.set(new_list)
+        self.provider = get_provider(new_list, self.case_sensitive, self.matcher)
+        self._show_first_page()
 
     def get_list(self):
         return self.full_list
@@ -258,12 +1333,21 @@ class AutocompleteEntryList(ttk.Frame):
         self.vscroll.configure(bootstyle=self.style)
 
 
-class AutocompleteCombobox(ttk.Frame):
+class AutocompleteCombobox(AutocompleteSearch, ttk.Frame):
     """
     Autocomplete Combobox Widget
     Filling the entry field filters the content from the combobox.
     Parameters:
+        values / combo_list: a list, an iterator, a function(query, offset, limit) returning a page of matches
+            or a ValueProvider (SQLiteProvider, for instance)
         case_sensitive: whether the search shall be case sensitive
+        filter_delay_ms: time (ms) without changes before the values are filtered (0 filters on every change)
+        threaded_search: whether the search runs on a worker thread (recommended for very large lists)
+        match_mode: 'substring', 'prefix', 'tokens' (all words, any order), 'fuzzy', 'regex' or a Matcher instance
+        top_k: if given, matches are ranked and only the best 'top_k' are shown
+            (match_mode and top_k are only available for lists of values, other providers match substrings)
+        page_size: maximum number of values fetched for the dropdown
+            (default: all the values for lists, 100 values for the other providers)
         all other parameters are the same as for a regular Combobox
     Methods for the user:
         set_list(new_list): sets a new list of values to the listbox widget
@@ -275,7 +1359,8 @@ class AutocompleteCombobox(ttk.Frame):
     """
 
     def __init__(self, parent, case_sensitive=False, style=None,
-                 combobox_method=None, **kwargs):
+                 combobox_method=None, filter_delay_ms=0, threaded_search=False, match_mode='substring',
+                 top_k=None, page_size=None, **kwargs):
 
         # Parent class initialization
         super().__init__(parent)
@@ -305,7 +1390,11 @@ class AutocompleteCombobox(ttk.Frame):
             pass
 
         # Values
-        self.combo_list = kwargs.get('values', [])
+        self.case_sensitive = case_sensitive
+        self.page_size = page_size
+        self._init_search(filter_delay_ms, threaded_search)
+        self.matcher = get_matcher(match_mode, top_k)
+        self._set_provider(kwargs.get('values', []))
         kwargs.pop('values')
 
         # Variable
@@ -315,55 +1404,71 @@ class AutocompleteCombobox(ttk.Frame):
         self.combobox = ttk.Combobox(self, values=self.combo_list, state='normal', textvariable=self.variable, **kwargs)
         self.combobox.grid(row=0, column=0, sticky='nsew')
 
-        # Bind method to the combobox
+        # Bind method to the combobox (placeholder rows are not selectable)
+        self._query = ''
+        self.combobox.bind('<<ComboboxSelected>>', self._placeholder_selected)
         if combobox_method and callable(combobox_method):
             self.combobox.bind('<<ComboboxSelected>>', combobox_method, add='+')
 
         self.variable.trace('w', self._entry_changed)
-        self.case_sensitive = case_sensitive
         self.is_disabled = False
         self.set_style(self.style)
 
     def _entry_changed(self, name, index, mode):
         """ Keeps track of any change in the entry widget and updates the dropdown values """
+        self._schedule_filter()
+
+    def _filter(self):
+        """ Filters the values with the current entry value and updates the dropdown values """
 
-        if self.variable.get() == '':
+        self._filter_job = None
+        query = self.variable.get()
+        self._query = query
+        if query == '':
+            self.background_search.cancel()
             self._set_filtered_values(values=self.combo_list)
 
-        else:
-            words = self._comparison()
-            if words:
-                self._set_filtered_values(values=words)
-            else:
-                self._set_filtered_values(values=['(no match)'])
-
-    def _comparison(self):
-        """ Responsible for the pattern match from the entry value """
-
-        if not self.case_sensitive:
-            pattern = re.compile('.*' + self.variable.get().upper() + '.*')
-            index = []
-            caps_values = [item.upper() for item in self.combo_list]
-            for i, name in enumerate(caps_values):
-                if re.match(pattern, name):
-                    index.append(i)
-        else:
-            pattern = re.compile('.*' + self.variable.get() + '.*')
-            index = []
-            for i, name in enumerate(self.combo_list):
-                if re.match(pattern, name):
-                    index.append(i)
+        elif self.threaded_search:
+            self.background_search.submit(self._search_task(), query)
 
-        result = [w for i, w in enumerate(self.combo_list) if i in index]
+        else:
+            self._search_finished(query, self._comparison(query))
 
-        return result
+    def _search_finished(self, query, words):
+        """ Updates the dropdown values with the search results """
+        if words:
+            self._set_filtered_values(values=words)
+        else:
+            self._set_filtered_values(values=(NO_MATCH,))
+
+    def _search_failed(self, query, error):
+        """ Receives the error of a failed search from the worker thread """
+        self._set_filtered_values(values=(SEARCH_ERROR,))
+
+    def _comparison(self, query=None, is_cancelled=None):
+        """
+        Responsible for the pattern match from the entry value.
+        """
+
+        if query is None:
+            query = self.variable.get()
+        return self.provider.search(query, 0, self._page_size(), is_cancelled)
+
+    def _set_provider(self, values):
+        """ Sets the provider for the values and the values shown when the entry is empty """
+        self.provider = get_provider(values, self.case_sensitive, self.matcher)
+        if isinstance(self.provider, ListProvider):
+            self.combo_list = values
+        else:
+            self.combo_list = self.provider.first_page(self._page_size())
 
     def _set_filtered_values(self, values):
         self.combobox.config(values=values)
 
     def set_combo_values(self, values):
-        self.combo_list = values
-        self.combobox.config(values=values)
+        self.background_search.cancel()
+        self._set_provider(values)
+        self.combobox.config(values=self.combo_list)
 
     def get_combo_values(self):
         return self.combo_list
@@ -372,7 +1477,7 @@ class AutocompleteCombobox(ttk.Frame):
         """ Sets a value to the entry widget """
         if self.is_disabled:
             return
-        if new_value in self.combo_list:
+        if new_value in self.provider:
             self.variable.set(new_value)
         else:
             self.variable.set('')
@@ -401,12 +1506,21 @@ class AutocompleteCombobox(ttk.Frame):
         self.combobox.configure(bootstyle=self.style)
 
 
-class AutocompleteLabelCombo(LabelCompoundWidget):
+class AutocompleteLabelCombo(AutocompleteSearch, LabelCompoundWidget):
     """
     Autocomplete compound widget which combines an Label Widget and a Autocomplete Combobox
     Filling the entry field filters the content from the combobox.
     Parameters:
+        values / combo_list: a list, an iterator, a function(query, offset, limit) returning a page of matches
+            or a ValueProvider (SQLiteProvider, for instance)
         case_sensitive: whether the search shall be case sensitive
+        filter_delay_ms: time (ms) without changes before the values are filtered (0 filters on every change)
+        threaded_search: whether the search runs on a worker thread (recommended for very large lists)
+        match_mode: 'substring', 'prefix', 'tokens' (all words, any order), 'fuzzy', 'regex' or a Matcher instance
+        top_k: if given, matches are ranked and only the best 'top_k' are shown
+            (match_mode and top_k are only available for lists of values, other providers match substrings)
+        page_size: maximum number of values fetched for the dropdown
+            (default: all the values for lists, 100 values for the other providers)
         all other parameters are the same as for a regular Combobox
     Methods for the user:
         set_list(new_list): sets a new list of values to the listbox widget
@@ -420,7 +1534,8 @@ class AutocompleteLabelCombo(LabelCompoundWidget):
     def __init__(self, parent, label_text='Label:', label_anchor='e', label_width=None,
                  label_justify=None, label_font=None, sided=True, combo_value='',
                  combo_list=('No values informed',), combo_width=None, combo_method=None,
-                 case_sensitive=False, style=None, **kwargs):
+                 case_sensitive=False, style=None, filter_delay_ms=0, threaded_search=False,
+                 match_mode='substring', top_k=None, page_size=None, **kwargs):
 
         # Parent class initialization
         super().__init__(parent, label_text, label_anchor, label_width, label_justify, label_font, sided, **kwargs)
@@ -441,11 +1556,14 @@ class AutocompleteLabelCombo(LabelCompoundWidget):
 
         # Combobox configuration
         if True:
-            self.combo_list = combo_list
             self.case_sensitive = case_sensitive
+            self.page_size = page_size
+            self._init_search(filter_delay_ms, threaded_search)
+            self.matcher = get_matcher(match_mode, top_k)
+            self._set_provider(combo_list)
             self.variable = tk.StringVar(value=combo_value)
             self.combobox = ttk.Combobox(self, textvariable=self.variable, justify='center',
-                                         values=combo_list, state='normal')
+                                         values=self.combo_list, state='normal')
             if sided:
                 self.combobox.grid(row=0, column=1, sticky='nsew', padx=2)
             else:
@@ -454,7 +1572,9 @@ class AutocompleteLabelCombo(LabelCompoundWidget):
             if combo_width:
                 self.combobox['width'] = combo_width
 
-        # Bind method to the combobox
+        # Bind method to the combobox (placeholder rows are not selectable)
+        self._query = combo_value
+        self.combobox.bind('<<ComboboxSelected>>', self._placeholder_selected)
         if combo_method:
             self.combobox.bind('<<ComboboxSelected>>', combo_method, add='+')
 
@@ -466,50 +1586,66 @@ class AutocompleteLabelCombo(LabelCompoundWidget):
 
     def _entry_changed(self, name, index, mode):
         """ Keeps track of any change in the entry widget and updates the dropdown values """
+        self._schedule_filter()
 
-        if self.variable.get() == '':
+    def _filter(self):
+        """ Filters the values with the current entry value and updates the dropdown values """
+
+        self._filter_job = None
+        query = self.variable.get()
+        self._query = query
+        if query == '':
+            self.background_search.cancel()
             self._set_filtered_values(values=self.combo_list)
 
-        else:
-            words = self._comparison()
-            if words:
-                self._set_filtered_values(values=words)
-            else:
-                self._set_filtered_values(values=['(no match)'])
-
-    def _comparison(self):
-        """ Responsible for the pattern match from the entry value """
-        if not self.case_sensitive:
-            pattern = re.compile('.*' + self.variable.get().upper() + '.*')
-            index = []
-            caps_values = [item.upper() for item in self.combo_list]
-            for i, name in enumerate(caps_values):
-                if re.match(pattern, name):
-                    index.append(i)
-        else:
-            pattern = re.compile('.*' + self.variable.get() + '.*')
-            index = []
-            for i, name in enumerate(self.combo_list):
-                if re.match(pattern, name):
-                    index.append(i)
+        elif self.threaded_search:
+            self.background_search.submit(self._search_task(), query)
 
-        result = [w for i, w in enumerate(self.combo_list) if i in index]
+        else:
+            self._search_finished(query, self._comparison(query))
 
-        return result
+    def _search_finished(self, query, words):
+        """ Updates the dropdown values with the search results """
+        if words:
+            self._set_filtered_values(values=words)
+        else:
+            self._set_filtered_values(values=(NO_MATCH,))
+
+    def _search_failed(self, query, error):
+        """ Receives the error of a failed search from the worker thread """
+        self._set_filtered_values(values=(SEARCH_ERROR,))
+
+    def _comparison(self, query=None, is_cancelled=None):
+        """
+        Responsible for the pattern match from the entry value.
+        """
+
+        if query is None:
+            query = self.variable.get()
+        return self.provider.search(query, 0, self._page_size(), is_cancelled)
+
+    def _set_provider(self, values):
+        """ Sets the provider for the values and the values shown when the entry is empty """
+        self.provider = get_provider(values, self.case_sensitive, self.matcher)
+        if isinstance(self.provider, ListProvider):
+            self.combo_list = values
+        else:
+            self.combo_list = self.provider.first_page(self._page_size())
 
     def _set_filtered_values(self, values):
         self.combobox.config(values=values)
 
     def set_combo_values(self, values):
-        self.combo_list = values
-        self.combobox.config(values=values)
+        self.background_search.cancel()
+        self._set_provider(values)
+        self.combobox.config(values=self.combo_list)
 
     def get_combo_values(self):
         return self.combo_list
 
     def get(self):
         current_value = self.variable.get()
-        if current_value in self.combo_list:
+        if current_value in self.provider:
             return current_value
         else:
             return ''
@@ -517,7 +1653,7 @@ class AutocompleteLabelCombo(LabelCompoundWidget):
     def set(self, value):
         if self.is_disabled:
             return
-        if value in self.combo_list:
+        if value in self.provider:
             self.variable.set(value)
         else:
             self.variable.set('')
@@ -1,6 +1,50 @@
 import tkinter as tk
 import ttkbootstrap as ttk
+from array import array
+from contextlib import contextmanager
+import csv
+import sys
 from .SCRIPTS import *
+from .UNITS import unit_registry
+from . import UNITS
+
+# Widgets with pending change notifications, for each interpreter within a 'batch_updates' block
+_batches = {}
+
+
+@contextmanager
+def batch_updates(root):
+    """
+    Context manager to update many compound widgets at once.
+    Within the block, the variable traces of all compound widgets on the interpreter of 'root' are muted.
+    When the (outermost) block exits, each traced widget (trace_variable=True) that changed gets a single change
+    notification, whether it was changed by its 'set' method or by a direct write to its variable.
+        with batch_updates(root):
+            widget_1.set(1)
+            widget_2.set(2)
+    An exception raised while notifying a widget is reported (as any Tk callback exception) and the remaining
+    widgets are still notified.
+    """
+
+    interpreter = root.tk
+    outermost = interpreter not in _batches
+    if outermost:
+        _batches[interpreter] = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            pending = _batches.pop(interpreter)
+            for widget in pending:
+                try:
+                    if not widget.winfo_exists():
+                        continue
+                except tk.TclError:
+                    continue
+                try:
+                    widget._update_value(None, None, 'write')
+                except Exception:
+                    widget._root().report_callback_exception(*sys.exc_info())
 
 
 class LabelCompoundWidget(ttk.Frame):
@@ -15,6 +59,10 @@ class LabelCompoundWidget(ttk.Frame):
         label_justify: multiline string alignment
         label_font: font to be used for the label
         sided: whether the label and the widget are positioned on the same line vs. in the same column
+    Change notifications (trace_variable=True):
+        'entry_method' is called with a 'tk.Event' whose 'widget' is the inner input widget (the one that used to
+        generate the '<Return>' or '<<ComboboxSelected>>' event) and whose 'type' is 'change'. It is not a real
+        Tk event: it carries no 'keysym', 'x' or 'y' fields.
     """
 
     def __init__(self, parent, label_text=None, label_anchor='e', label_width=None,
@@ -24,6 +72,9 @@ class LabelCompoundWidget(ttk.Frame):
         super().__init__(parent, **kwargs)
         self.parent = parent
         self.disabled = False
+        self.muted = False
+        self.notify_delay_ms = None
+        self._notify_job = None
 
         # Style definition
         self.label_style_list = (
@@ -106,6 +157,61 @@ class LabelCompoundWidget(ttk.Frame):
                 except:
                     widget.configure(bootstyle='default')
 
+    @contextmanager
+    def _muted_trace(self):
+        """ Changes the widget variables without calling the trace method """
+        muted = self.muted
+        self.muted = True
+        try:
+            yield
+        finally:
+            self.muted = muted
+
+    def _trace_is_muted(self):
+        """
+        Checks whether the trace method shall return without notifying the change.
+        Within a 'batch_updates' block the widget is kept for a single notification when the block exits, even if
+        the change was made with the trace muted (by the 'set' method, for instance).
+        """
+        pending = _batches.get(self.tk)
+        if pending is not None:
+            pending[self] = None
+            return True
+        return self.muted
+
+    def _notify_change(self):
+        """
+        Schedules a call to 'entry_method' after a change of the widget variable.
+        The call happens when idle or, if a delay is set, 'notify_delay_ms' after the first change.
+        Any change until then is covered by the same call.
+        """
+        if not self.entry_method or self._notify_job is not None:
+            return
+        if self.notify_delay_ms:
+            self._notify_job = self.after(self.notify_delay_ms, self._deliver_change)
+        else:
+            self._notify_job = self.after_idle(self._deliver_change)
+
+    def _change_widget(self):
+        """ Inner widget given as 'event.widget' on the change notifications """
+        return self
+
+    def _deliver_change(self):
+        """ Calls 'entry_method' with an event from the inner widget """
+        self._notify_job = None
+        if self.entry_method:
+            event = tk.Event()
+            event.widget = self._change_widget()
+            event.type = 'change'
+            self.entry_method(event)
+
+    def destroy(self):
+        """ Cancels any pending change notification before destroying the widget """
+        if self._notify_job is not None:
+            self.after_cancel(self._notify_job)
+            self._notify_job = None
+        super().destroy()
+
 
 class LabelCombo(LabelCompoundWidget):
     """
@@ -199,6 +305,8 @@ class LabelEntry(LabelCompoundWidget):
         entry_numeric: whether the entry accepts only numbers
         entry_width: entry width in number of characters
         entry_method: method to associate with the entry events
+        notify_delay_ms: with trace_variable, time (ms) to gather the changes before calling entry_method
+                         (None calls it once when idle)
         entry_max_char: maximum number of characters in the entry field
     Methods for the user:
         enable(): turns the whole widget 'on'
@@ -211,7 +319,8 @@ class LabelEntry(LabelCompoundWidget):
     def __init__(self, parent, label_text=None, label_anchor='e', label_width=None,
                  label_justify=None, label_font=None, sided=True,
                  entry_value='', entry_numeric=False, entry_width=None, entry_max_char=None,
-                 entry_method=None, precision=2, trace_variable=False, style=None, **kwargs):
+                 entry_method=None, precision=2, trace_variable=False, notify_delay_ms=None, style=None,
+                 **kwargs):
 
         # Parent class initialization
         super().__init__(parent, label_text, label_anchor, label_width, label_justify,
@@ -225,14 +334,15 @@ class LabelEntry(LabelCompoundWidget):
             self.entry_method = None
         self.precision = precision
         self.trace_variable = trace_variable
+        self.notify_delay_ms = notify_delay_ms
 
         # Entry validation for numbers and max char
         if True:
             if self.precision == 0:
-                validate_numbers = self.register(int_only)
+                validate_numbers = register_validator(self, get_validator('int', entry_max_char))
             else:
-                validate_numbers = self.register(float_only)
-            validate_chars = self.register(max_chars)
+                validate_numbers = register_validator(self, get_validator('float', entry_max_char))
+            validate_chars = register_validator(self, get_validator('max_chars', entry_max_char))
 
         # Entry configuration
         if True:
@@ -252,14 +362,14 @@ class LabelEntry(LabelCompoundWidget):
             if entry_numeric:
                 if not isfloat(entry_value):
                     self.variable.set('')
-                self.entry.config(validate='all',
-                                  validatecommand=(validate_numbers, '%d', '%P', '%S', entry_max_char))
+                self.entry.config(validate='key',
+                                  validatecommand=(validate_numbers, '%d', '%P', '%S'))
 
             # Restrict max characters
             if entry_max_char and not entry_numeric:
                 entry_value = str(entry_value[:entry_max_char])
                 self.variable.set(entry_value)
-                self.entry.config(validate='all', validatecommand=(validate_chars, '%d', '%P', entry_max_char))
+                self.entry.config(validate='key', validatecommand=(validate_chars, '%d', '%P'))
 
         # Bind method
         if True:
@@ -274,9 +384,12 @@ class LabelEntry(LabelCompoundWidget):
     def _update_value(self, name, index, mode):
         """ Variable trace method. Calls the applicable method everytime the value changes """
 
-        if self.entry_method:
-            self.entry.event_generate("<Return>")
-            # To call the self.entry_method()
+        if self._trace_is_muted():
+            return
+        self._notify_change()
+
+    def _change_widget(self):
+        return self.entry
 
     def _adjust_value(self, event):
         """
@@ -287,19 +400,11 @@ class LabelEntry(LabelCompoundWidget):
         if self.entry_numeric:
             if isfloat(value):
                 value = float(value)
-                if self.trace_variable:
-                    self.variable.trace_remove('write', self.cb_name)
-                    self.variable.set(f'{value:.{self.precision}f}')
-                    self.cb_name = self.variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     self.variable.set(f'{value:.{self.precision}f}')
 
         else:
-            if self.trace_variable:
-                self.variable.trace_remove('write', self.cb_name)
-                self.variable.set(value)
-                self.cb_name = self.variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.variable.set(value)
 
         if self.entry_method:
@@ -330,28 +435,16 @@ class LabelEntry(LabelCompoundWidget):
 
         if self.entry_numeric:
             if value == '':
-                if self.trace_variable:
-                    self.variable.trace_remove('write', self.cb_name)
-                    self.variable.set(value)
-                    self.cb_name = self.variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     self.variable.set(value)
             elif isfloat(value):
                 value = float(value)
                 if self.precision == 0:
                     value = int(value)
-                    if self.trace_variable:
-                        self.variable.trace_remove('write', self.cb_name)
-                        self.variable.set(str(value))
-                        self.cb_name = self.variable.trace_add("write", self._update_value)
-                    else:
+                    with self._muted_trace():
                         self.variable.set(str(value))
                 else:
-                    if self.trace_variable:
-                        self.variable.trace_remove('write', self.cb_name)
-                        self.variable.set(f'{value:.{self.precision}f}')
-                        self.cb_name = self.variable.trace_add("write", self._update_value)
-                    else:
+                    with self._muted_trace():
                         self.variable.set(f'{value:.{self.precision}f}')
             else:
                 return
@@ -359,11 +452,7 @@ class LabelEntry(LabelCompoundWidget):
         else:
             if self.entry_max_chars:
                 value = str(value)[:self.entry_max_chars]
-            if self.trace_variable:
-                self.variable.trace_remove('write', self.cb_name)
-                self.variable.set(value)
-                self.cb_name = self.variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.variable.set(value)
 
 
@@ -499,6 +588,8 @@ class LabelSpinbox(LabelCompoundWidget):
         entry_value: initial value to show at the entry (if any)
         entry_width: entry width in number of characters
         entry_method: method to associate with the entry events
+        notify_delay_ms: with trace_variable, time (ms) to gather the changes before calling entry_method
+                         (None calls it once when idle)
         entry_type: whether the value will be a float or an integer
         spin_start: initial spinbox value
         spin_end: spinbox end_value
@@ -516,7 +607,7 @@ class LabelSpinbox(LabelCompoundWidget):
                  label_justify=None, label_font=None, sided=True,
                  entry_value=None, entry_width=None, entry_method=None, entry_type='float',
                  spin_start=0, spin_end=10, spin_increment=1, spin_precision=2,
-                 trace_variable=False, style=None, **kwargs):
+                 trace_variable=False, notify_delay_ms=None, style=None, **kwargs):
 
         # Parent class initialization
         super().__init__(parent, label_text, label_anchor, label_width, label_justify,
@@ -530,6 +621,7 @@ class LabelSpinbox(LabelCompoundWidget):
         self.type = entry_type
         self.initial_value = entry_value
         self.trace_variable = trace_variable
+        self.notify_delay_ms = notify_delay_ms
         if self.increment < 1 / 10 ** self.precision:
             print(f'current increment: {self.increment}')
             print(f'current precision: {self.precision}. Smaller increment: {1 / 10 ** self.precision}')
@@ -592,14 +684,17 @@ class LabelSpinbox(LabelCompoundWidget):
         self.set_style()
 
     def _update_value(self, name, index, mode):
+        if self._trace_is_muted():
+            return
         current = self.variable.get()
         if isfloat(current):
-            if self.entry_method:
-                self.spin.event_generate("<Return>")
-                # To call the self.entry_method()
+            self._notify_change()
         else:
             self.spin.delete(self.spin.index("insert"), last='end')
 
+    def _change_widget(self):
+        return self.spin
+
     def _spin_selected(self, event=None):
         if self.spin.cget("state") == 'readonly':
             return
@@ -735,11 +830,7 @@ class LabelSpinbox(LabelCompoundWidget):
             return
 
         if value in (None, ''):
-            if self.trace_variable:
-                self.variable.trace_remove('write', self.cb_name)
-                self.variable.set('')
-                self.cb_name = self.variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.variable.set('')
             return
 
@@ -760,11 +851,7 @@ class LabelSpinbox(LabelCompoundWidget):
         else:
             value = str(round(float(new_value), self.precision))
 
-        if self.trace_variable:
-            self.variable.trace_remove('write', self.cb_name)
-            self.variable.set(value)
-            self.cb_name = self.variable.trace_add("write", self._update_value)
-        else:
+        with self._muted_trace():
             self.variable.set(value)
 
 
@@ -776,6 +863,8 @@ class LabelEntryUnit(LabelCompoundWidget):
         entry_value: initial value to show at the entry (if any)
         entry_width: entry width in number of characters
         entry_method: method to associate with the entry events
+        notify_delay_ms: with trace_variable, time (ms) to gather the changes before calling entry_method
+                         (None calls it once when idle)
         combobox_unit: unit system for the entry
         combobox_unit_width: width of the combobox in characters
         combobox_unit_conversion: boolean, if set to True converts the entry value when the unit is changed
@@ -805,6 +894,8 @@ class LabelEntryUnit(LabelCompoundWidget):
         (almost) Static Methods: return (Value, Unit)
         convert_data_to_metric(value, unit): converts the given pair to the equivalent metric unit
         convert_data_to_imperial(value, unit): converts the given pair to the equivalent imperial unit
+        convert_array_to_metric(values, units): converts many values at once (returns values, units)
+        convert_array_to_imperial(values, units): converts many values at once (returns values, units)
         convert_to_given_unit((old_value, old_unit), new_unit): converts the given pair to the given unit
     Internal Classes:
         NoUnitCombo: ('-')
@@ -827,7 +918,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('-',)
+            self.quantity = 'none'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value='-')
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -836,7 +929,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('°C', '°F')
+            self.quantity = 'temperature'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -845,8 +940,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('°C/s', '°C/min', '°C/hour', '°F/s', '°F/min', '°F/hour')
-            self.conversion_values = (1, 1/60, 1/3600, 1.8, 0.03, 0.0005)
+            self.quantity = 'temperature rate'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -855,8 +951,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('mm', 'cm', 'm', 'in')
-            self.conversion_values = (1, 10, 1000, 25.4)
+            self.quantity = 'length'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
 
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
@@ -866,8 +963,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('s', 'min', 'hour', 'day', 'year')
-            self.conversion_values = (1, 60, 3600, 86400, 3.1536e7)
+            self.quantity = 'time'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
 
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
@@ -877,8 +975,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('mm²', 'cm²', 'm²', 'in²')
-            self.conversion_values = (1, 100, 1000000, 645.16)
+            self.quantity = 'area'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
 
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
@@ -888,8 +987,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('kPa', 'bar', 'kgf/cm²', 'MPa', 'atmosphere', 'ksi', 'psi')
-            self.conversion_values = (1, 100, 98.0665, 1000, 101.325, 6894.757, 6.894757)
+            self.quantity = 'pressure'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
 
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
@@ -899,8 +999,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('MPa', 'GPa', 'x10³ ksi', 'psi', 'ksi')
-            self.conversion_values = (1, 1000, 6894.757, 0.006894757, 6.894757)
+            self.quantity = 'stress'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -909,8 +1010,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('N', 'kN', 'kgf', 'lbf')
-            self.conversion_values = (1, 1000, 9.80665, 4.448222)
+            self.quantity = 'force'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -919,8 +1021,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('N.m', 'kN.m', 'kgf.m', 'lbf.ft')
-            self.conversion_values = (1, 1000, 9.80665, 1.35582)
+            self.quantity = 'moment'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -929,8 +1032,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('joule', 'ft-lbf')
-            self.conversion_values = (1, 1.355818)
+            self.quantity = 'energy'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -939,8 +1043,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('MPa.√m', 'N/mm^(3/2)', 'ksi.√in')
-            self.conversion_values = (1, 0.031621553, 1.0988015)
+            self.quantity = 'toughness'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -949,8 +1054,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('joule/m²', 'ft-lbf/ft²')
-            self.conversion_values = (1, 14.5939)
+            self.quantity = 'j-integral'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -959,8 +1065,9 @@ class LabelEntryUnit(LabelCompoundWidget):
         def __init__(self, parent, width):
             super().__init__(parent)
 
-            self.values = ('10e-6/°C', '10e-6/°F')
-            self.conversion_values = (1, 1.79856)
+            self.quantity = 'thermal expansion'
+            self.values = unit_registry.units(self.quantity)
+            self.conversion_values = unit_registry.conversion_values(self.quantity)
             self.variable = tk.StringVar(value=self.values[0])
             self.configure(textvariable=self.variable, justify='center', width=width, values=self.values,
                            state='readonly')
@@ -983,58 +1090,22 @@ class LabelEntryUnit(LabelCompoundWidget):
         'thermal expansion': ThermalExpansionCombo
     }
 
-    # List which identifies unit as SI or Custom.
+    # Lists which identify units as SI or Custom (see UNITS).
     # Their position in list guides its conversion constants.
     #       imperial_unit_list[index] * conversion[index] => metric_unit_list[index]
-    # Temperature, Temperature Rate and time units are excluded from the lists.
-    metric_unit_list = \
-        ('°C/s', '°C/min', '°C/hour',                           # TemperatureRateCombo
-         'mm', 'cm',  'm',                                      # LengthCombo
-         'mm²', 'cm²', 'm²',                                    # AreaCombo
-         'kPa', 'kPa', 'bar', 'kgf/cm²', 'MPa', 'atmosphere',   # PressureCombo
-         'GPa',                                                 # StressCombo
-         'N', 'kN', 'kgf',                                      # ForceCombo
-         'N.m', 'kN.m', 'kgf.m',                                # MomentCombo
-         '-',                                                   # NoUnitCombo
-         'N/mm^(3/2)', 'MPa.√m',                                # ToughnessCombo
-         'joule',                                               # EnergyCombo
-         'joule/m²',                                            # JIntegralCombo
-         '10e-6/°C',                                            # Thermal Expansion
-         )
-    imperial_unit_list = \
-        ('°F/s', '°F/min', '°F/hour',
-         'in', 'in', 'in',
-         'in²', 'in²', 'in²',
-         'psi', 'ksi', 'ksi', 'ksi', 'ksi', 'psi',
-         'x10³ ksi',
-         'lbf', 'lbf', 'lbf',
-         'lbf.ft', 'lbf.ft', 'lbf.ft',
-         '-',
-         'ksi.√in', 'ksi.√in',
-         'ft-lbf',
-         'ft-lbf/ft²',
-         '10e-6/°F')
+    # Temperature and time units are excluded from the lists.
+    metric_unit_list = UNITS.metric_unit_list
+    imperial_unit_list = UNITS.imperial_unit_list
 
     # List with the conversion values from imperial to metric
-    conversion = \
-        (0.55556, 0.55556, 0.55556,
-         25.4, 2.54, 0.0254,
-         645.16, 6.4516, 0.00064516,
-         6.894757, 6894.757, 68.94757, 70.30696, 6.894757, 0.06804596,
-         6.894757e6,
-         4.448222, 0.004448222, 0.4535924,
-         1.35582, 0.00135582, 0.1382552,
-         1,
-         34.7485, 1.0988,
-         1.355818,
-         14.5939,
-         0.55556)
+    conversion = tuple(unit_registry.factor(imperial_unit, metric_unit)[0] for imperial_unit, metric_unit
+                       in zip(UNITS.imperial_unit_list, UNITS.metric_unit_list))
 
     def __init__(self, parent, label_text=None, label_anchor='e', label_width=None,
                  label_justify=None, label_font=None, sided=True,
                  entry_value=None, entry_width=None, entry_method=None,
                  combobox_unit=None, combobox_unit_width=8, combobox_unit_conversion=False,
-                 precision=2, trace_variable=False, style=None, **kwargs):
+                 precision=2, trace_variable=False, notify_delay_ms=None, style=None, **kwargs):
 
         # Parent class initialization
         super().__init__(parent, label_text, label_anchor, label_width, label_justify,
@@ -1042,9 +1113,9 @@ class LabelEntryUnit(LabelCompoundWidget):
 
         # Entry validation for numbers
         if precision == 0:
-            validate_numbers = self.register(int_only)
+            validate_numbers = register_validator(self, get_validator('int'))
         else:
-            validate_numbers = self.register(float_only)
+            validate_numbers = register_validator(self, get_validator('float'))
 
         # Local frame
         if True:
@@ -1062,6 +1133,7 @@ class LabelEntryUnit(LabelCompoundWidget):
             self.parent = parent
             self.precision = precision
             self.trace_variable = trace_variable
+            self.notify_delay_ms = notify_delay_ms
             if entry_method and callable(entry_method):
                 self.entry_method = entry_method
             else:
@@ -1084,7 +1156,7 @@ class LabelEntryUnit(LabelCompoundWidget):
 
             # Restrict numeric values
             if True:
-                self.entry.config(validate='all', validatecommand=(validate_numbers, '%d', '%P', '%S'))
+                self.entry.config(validate='key', validatecommand=(validate_numbers, '%d', '%P', '%S'))
 
             self.last_value = entry_value
 
@@ -1123,9 +1195,12 @@ class LabelEntryUnit(LabelCompoundWidget):
 
     def _update_value(self, name, index, mode):
         """ Variable trace method. Calls the applicable method everytime the value changes """
-        if self.entry_method:
-            self.unit_combo.event_generate("<<ComboboxSelected>>")
-            # to call the self.entry_method()
+        if self._trace_is_muted():
+            return
+        self._notify_change()
+
+    def _change_widget(self):
+        return self.unit_combo
 
     def _adjust_value(self, event):
         """ Precision adjustment method. Called when 'focus' is taken away from the widget. """
@@ -1133,25 +1208,14 @@ class LabelEntryUnit(LabelCompoundWidget):
         value = self.get_entry()
         if isfloat(value):
             value = float(value)
-            if self.trace_variable:
-                self.entry_variable.trace_remove('write', self.cb_name)
-                if 0 < value < 1 / (10 ** (self.precision - 1)):
-                    self.entry_variable.set(f'{value:.{self.precision}e}')
-                else:
-                    self.entry_variable.set(f'{value:.{self.precision}f}')
-                self.cb_name = self.entry_variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 if 0 < value < 1 / (10 ** (self.precision - 1)):
                     self.entry_variable.set(f'{value:.{self.precision}e}')
                 else:
                     self.entry_variable.set(f'{value:.{self.precision}f}')
 
         else:
-            if self.trace_variable:
-                self.entry_variable.trace_remove('write', self.cb_name)
-                self.entry_variable.set('')
-                self.cb_name = self.entry_variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.entry_variable.set('')
 
         if self.entry_method:
@@ -1233,11 +1297,7 @@ class LabelEntryUnit(LabelCompoundWidget):
         if value in ('', 'NA'):
             if update_last_value:
                 self.last_value = 0
-            if self.trace_variable:
-                self.entry_variable.trace_remove('write', self.cb_name)
-                self.entry_variable.set(value)
-                self.cb_name = self.entry_variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.entry_variable.set(value)
             return
 
@@ -1249,21 +1309,10 @@ class LabelEntryUnit(LabelCompoundWidget):
             value = float(value)
             if self.precision == 0:
                 value = int(value)
-                if self.trace_variable:
-                    self.entry_variable.trace_remove('write', self.cb_name)
-                    self.entry_variable.set(str(value))
-                    self.cb_name = self.entry_variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     self.entry_variable.set(str(value))
             else:
-                if self.trace_variable:
-                    self.entry_variable.trace_remove('write', self.cb_name)
-                    if 0 < value < 1 / (10 ** (self.precision - 1)):
-                        self.entry_variable.set(f'{value:.{self.precision}e}')
-                    else:
-                        self.entry_variable.set(f'{value:.{self.precision}f}')
-                    self.cb_name = self.entry_variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     if 0 < value < 1 / (10 ** (self.precision - 1)):
                         self.entry_variable.set(f'{value:.{self.precision}e}')
                     else:
@@ -1305,62 +1354,24 @@ class LabelEntryUnit(LabelCompoundWidget):
     def get_metric_value(self):
         """
         Returns the current value converted to the equivalent metric unit.
-        The selected metric unit is the first from the combobox values.
+        The selected metric unit is defined for each quantity on the unit registry.
         """
 
         if self.is_disabled():
             return '', ''
 
-        if isinstance(self.unit_combo, LabelEntryUnit.NoUnitCombo):
-            return self.get_entry(), '-'
-
-        if isinstance(self.unit_combo, LabelEntryUnit.TemperatureCombo):
-            if str(self.get_unit()) == '°F':
-                if not str(self.get_entry()):
-                    return '', '°C'
-                else:
-                    return 5 * (float(self.get_entry()) - 32) / 9, '°C'
-            return self.get_entry(), '°C'
-
-        index = self.unit_combo.values.index(self.get_unit())
-        if not str(self.get_entry()):
-            return '', self.unit_combo.values[0]
-        else:
-            return float(self.get_entry()) * self.unit_combo.conversion_values[index], self.unit_combo.values[0]
+        return self.convert_to_given_unit(self.get(), unit_registry.metric_unit(self.unit_combo.quantity))
 
     def get_imperial_value(self):
         """
         Returns the current value converted to the equivalent imperial unit.
-        The selected imperial unit is the last from the combobox values.
+        The selected imperial unit is defined for each quantity on the unit registry.
         """
 
         if self.is_disabled():
             return '', ''
 
-        if isinstance(self.unit_combo, LabelEntryUnit.NoUnitCombo):
-            return self.get_entry(), '-'
-
-        if isinstance(self.unit_combo, LabelEntryUnit.TemperatureCombo):
-            if str(self.get_unit()) == '°C':
-                if not str(self.get_entry()):
-                    return '', '°F'
-                else:
-                    return 9 * float(self.get_entry())/5 + 32, '°F'
-            return self.get_entry(), '°F'
-
-        index = self.unit_combo.values.index(self.get_unit())
-        if not str(self.get_entry()):
-            return '', self.unit_combo.values[-1]
-        else:
-            if isinstance(self.unit_combo, LabelEntryUnit.TimeCombo):
-                final_index = 0
-            else:
-                final_index = -1
-            last_value = self.get_entry()
-            intermediary_value = float(last_value) * self.unit_combo.conversion_values[index]
-            new_value = intermediary_value / self.unit_combo.conversion_values[final_index]
-
-            return new_value, self.unit_combo.values[final_index]
+        return self.convert_to_given_unit(self.get(), unit_registry.imperial_unit(self.unit_combo.quantity))
 
     def convert_to_metric(self):
         """ Convert 'self' to metric """
@@ -1380,54 +1391,140 @@ class LabelEntryUnit(LabelCompoundWidget):
     def convert_data_to_metric(value, unit):
         """
         Convert any given data (value, unit) to metric.
-        Uses the main conversion lists for the operation.
+        Uses the unit registry pairs for the operation.
         """
 
         if unit == '-':
             return None, None
 
-        elif unit == '°F':
-            if not str(value):
-                new_value = ''
-            else:
-                new_value = 5 * (float(value) - 32) / 9
-            return new_value, '°C'
-
-        else:
-            if unit not in LabelEntryUnit.metric_unit_list:
-                index = LabelEntryUnit.imperial_unit_list.index(unit)
-                if not str(value):
-                    new_value = ''
-                else:
-                    new_value = float(value)*LabelEntryUnit.conversion[index]
-                return new_value, LabelEntryUnit.metric_unit_list[index]
+        new_unit = unit_registry.to_metric(unit)
+        if new_unit == unit:
             return value, unit
+        if not str(value):
+            return '', new_unit
+        return unit_registry.convert(float(value), unit, new_unit), new_unit
 
     @staticmethod
     def convert_data_to_imperial(value, unit):
         """
         Convert any given data (value, unit) to imperial.
-        Uses the main conversion lists for the operation.
+        Uses the unit registry pairs for the operation.
         """
+
         if unit == '-':
             return None, None
 
-        elif unit == '°C':
-            if not str(value):
-                new_value = ''
-            else:
-                new_value = 9 * (float(value) / 5) + 32
-            return new_value, '°F'
+        new_unit = unit_registry.to_imperial(unit)
+        if new_unit == unit:
+            return value, unit
+        if not str(value):
+            return '', new_unit
+        return unit_registry.convert(float(value), unit, new_unit), new_unit
+
+    # Factors (scale, offset, new unit) for the array conversions, built on the first use
+    _array_factors = {}
 
+    @staticmethod
+    def _get_array_factors(to_metric):
+        """
+        Dictionary with the factors (scale, offset, new unit) for each known unit.
+        Built from the unit registry pairs, so that 'new value = value * scale + offset'.
+        """
+
+        factors = LabelEntryUnit._array_factors.get(to_metric)
+        if factors is not None:
+            return factors
+
+        pairs = unit_registry.metric_pairs if to_metric else unit_registry.imperial_pairs
+        factors = {unit: unit_registry.factor(unit, new_unit) + (new_unit,) for unit, new_unit in pairs.items()}
+
+        LabelEntryUnit._array_factors[to_metric] = factors
+        return factors
+
+    @staticmethod
+    def _convert_array(values, units, to_metric):
+        """
+        Converts many values at once, with a single unit (str) or with one unit per value.
+        Uses NumPy if available (returns arrays), otherwise pure Python (returns lists).
+        Empty values are returned as NaN.
+        """
+
+        factors = LabelEntryUnit._get_array_factors(to_metric)
+
+        def get_factors(unit):
+            try:
+                return factors[unit]
+            except KeyError:
+                raise Exception(f'Unit {unit} not found in current units dictionary.')
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is None:
+            values = [float(value) if isfloat(value) else float('nan') for value in values]
+            if isinstance(units, str):
+                scale, offset, new_unit = get_factors(units)
+                return [value * scale + offset for value in values], new_unit
+
+            units = list(units)
+            if len(units) != len(values):
+                raise ValueError('Values and units shall have the same length.')
+            unit_factors = {unit: get_factors(unit) for unit in set(units)}
+            new_values = []
+            new_units = []
+            for value, unit in zip(values, units):
+                scale, offset, new_unit = unit_factors[unit]
+                new_values.append(value * scale + offset)
+                new_units.append(new_unit)
+            return new_values, new_units
+
+        try:
+            values = np.asarray(values, dtype=float)
+        except ValueError:
+            values = np.array([float(value) if isfloat(value) else np.nan for value in values], dtype=float)
+
+        if isinstance(units, str):
+            scale, offset, new_unit = get_factors(units)
+            return values * scale + offset, new_unit
+
+        # Each value gets the code of its unit, so the factors are looked up once per unit
+        if isinstance(units, np.ndarray):
+            unique_units, inverse = np.unique(units, return_inverse=True)
+            unique_units = unique_units.tolist()
         else:
-            if unit not in LabelEntryUnit.imperial_unit_list:
-                index = LabelEntryUnit.metric_unit_list.index(unit)
-                if not str(value):
-                    new_value = ''
-                else:
-                    new_value = float(value) / LabelEntryUnit.conversion[index]
-                return new_value, LabelEntryUnit.imperial_unit_list[index]
-            return value, unit
+            codes = {}
+            inverse = np.fromiter((codes.setdefault(unit, len(codes)) for unit in units), dtype=np.intp)
+            unique_units = list(codes)
+        if inverse.size != values.size:
+            raise ValueError('Values and units shall have the same length.')
+        unique_factors = [get_factors(unit) for unit in unique_units]
+        scales = np.array([scale for scale, _, _ in unique_factors], dtype=float)
+        offsets = np.array([offset for _, offset, _ in unique_factors], dtype=float)
+        new_units = np.array([new_unit for _, _, new_unit in unique_factors], dtype=object)
+        inverse = inverse.reshape(values.shape)
+        return values * scales[inverse] + offsets[inverse], new_units[inverse]
+
+    @staticmethod
+    def convert_array_to_metric(values, units):
+        """
+        Convert many values at once to metric (the batch version of 'convert_data_to_metric').
+        'units' is either a single unit for all values or a sequence with one unit per value.
+        Returns the converted values and units (NumPy arrays if NumPy is available, otherwise lists).
+        Dimensionless values ('-') are returned unchanged.
+        """
+        return LabelEntryUnit._convert_array(values, units, to_metric=True)
+
+    @staticmethod
+    def convert_array_to_imperial(values, units):
+        """
+        Convert many values at once to imperial (the batch version of 'convert_data_to_imperial').
+        'units' is either a single unit for all values or a sequence with one unit per value.
+        Returns the converted values and units (NumPy arrays if NumPy is available, otherwise lists).
+        Dimensionless values ('-') are returned unchanged.
+        """
+        return LabelEntryUnit._convert_array(values, units, to_metric=False)
 
     def convert_to_given_unit(self, old_data, given_unit):
         """
@@ -1438,44 +1535,12 @@ class LabelEntryUnit(LabelCompoundWidget):
         last_unit = old_data[1]
         new_unit = given_unit
 
-        if isinstance(self.unit_combo, LabelEntryUnit.NoUnitCombo):
+        if isinstance(self.unit_combo, LabelEntryUnit.NoUnitCombo) or last_unit == new_unit:
             return last_value, last_unit
 
-        elif isinstance(self.unit_combo, LabelEntryUnit.TemperatureCombo):
-            if last_unit == new_unit:
-                return last_value, last_unit
-
-            else:
-                if new_unit == '°F':
-                    if not str(last_value):
-                        new_value = ''
-                    else:
-                        new_value = 9 * (float(last_value) / 5) + 32
-                    return new_value, '°F'
-                else:
-                    if not str(last_value):
-                        new_value = ''
-                    else:
-                        new_value = 5 * (float(last_value) - 32) / 9
-                    return new_value, '°C'
-
-        else:
-            if last_unit == new_unit:
-                return last_value, last_unit
-
-            else:
-                old_index = self.unit_combo.values.index(last_unit)
-                new_index = self.unit_combo.values.index(new_unit)
-                if not str(last_value):
-                    new_value = ''
-                else:
-                    # Convert from old index to index 1
-                    intermediary_value = float(last_value) * self.unit_combo.conversion_values[old_index]
-
-                    # Convert from index 1 to new index
-                    new_value = intermediary_value / self.unit_combo.conversion_values[new_index]
-
-                return new_value, new_unit
+        if not str(last_value):
+            return '', new_unit
+        return unit_registry.convert(float(last_value), last_unit, new_unit), new_unit
 
     def _convert_to_selected_unit(self, event=None):
         """
@@ -1489,43 +1554,312 @@ class LabelEntryUnit(LabelCompoundWidget):
         if isinstance(self.unit_combo, LabelEntryUnit.NoUnitCombo):
             pass
 
-        elif isinstance(self.unit_combo, LabelEntryUnit.TemperatureCombo):
-            if new_unit == last_unit:
-                self.set_entry(last_value)
+        elif new_unit == last_unit:
+            self.set_entry(last_value)
+
+        else:
+            new_value, new_unit = self.convert_to_given_unit((last_value, last_unit), new_unit)
+            self.set_unit(new_unit, update_last_unit=False)
+            self.set_entry(new_value, update_last_value=False)
+
+
+class UnitSystemController:
+    """
+    Switches many LabelEntryUnit widgets between the metric and the imperial unit systems in a single pass.
+    All the new values are computed first (one factor lookup per pair of units), then applied to the widgets with
+    their traces muted, so Tk redraws the whole form only once, when idle.
+    Parameters:
+        widgets: LabelEntryUnit widgets to be controlled
+    Methods for the user:
+        register(*widgets): adds widgets to the controller
+        register_children(parent): adds all LabelEntryUnit widgets within the parent widget
+        unregister(*widgets): removes widgets from the controller
+        to_metric(): converts all widgets to the metric unit system
+        to_imperial(): converts all widgets to the imperial unit system
+    """
+
+    def __init__(self, widgets=()):
+        self.widgets = []
+        self.unit_system = None
+        self.register(*widgets)
+
+    def register(self, *widgets):
+        for widget in widgets:
+            if not isinstance(widget, LabelEntryUnit):
+                raise Exception('Only LabelEntryUnit widgets may be registered on a UnitSystemController.')
+            if widget not in self.widgets:
+                self.widgets.append(widget)
+
+    def register_children(self, parent):
+        """ Registers all LabelEntryUnit widgets within the parent widget (at any depth) """
+        pending = [parent]
+        while pending:
+            widget = pending.pop()
+            if isinstance(widget, LabelEntryUnit):
+                self.register(widget)
             else:
-                if new_unit == '°F':
-                    if not str(last_value):
-                        new_value = ''
-                    else:
-                        new_value = 9 * (float(last_value) / 5) + 32
+                pending.extend(widget.winfo_children())
+
+    def unregister(self, *widgets):
+        for widget in widgets:
+            if widget in self.widgets:
+                self.widgets.remove(widget)
+
+    def to_metric(self):
+        self._convert(unit_registry.metric_unit)
+        self.unit_system = 'metric'
+
+    def to_imperial(self):
+        self._convert(unit_registry.imperial_unit)
+        self.unit_system = 'imperial'
+
+    def _convert(self, get_target_unit):
+        """ Computes the new (value, unit) for every widget, then applies them all """
+
+        # New values
+        updates = []
+        for widget in self.widgets:
+            if widget.is_locked or widget.is_disabled():
+                continue
+            unit = widget.combobox_variable.get()
+            new_unit = get_target_unit(widget.unit_combo.quantity)
+            if unit == new_unit or unit not in widget.unit_combo.values:
+                continue
+            value = widget.get_entry()
+            if value != '':
+                value = unit_registry.convert(value, unit, new_unit)
+            updates.append((widget, value, new_unit))
+
+        # Widgets update, without calling the trace methods
+        for widget, value, unit in updates:
+            with widget._muted_trace():
+                widget.set_entry(value)
+                widget.set_unit(unit)
+
+
+class FormSnapshots:
+    """
+    Column store for the numeric values of a FormModel, recorded one snapshot (row) at a time.
+    Each key has a column of floats (empty or non-numeric values are stored as NaN) on a preallocated array, which
+    doubles its capacity when full. LabelEntryUnit keys also have a column of unit codes, the unit names being
+    stored only once.
+    Parameters:
+        form: FormModel with the values to be recorded
+        keys: keys to be recorded (all LabelEntry and LabelEntryUnit keys if not given)
+        capacity: number of snapshots initially allocated
+    Methods for the user:
+        record(): records the current values of the form as a new snapshot
+        column(key): values of a key on all snapshots (as a numpy array, if numpy is available)
+        unit_column(key): units of a LabelEntryUnit key on all snapshots
+        clear(): removes all snapshots
+        export_csv(file_name): writes all snapshots to a CSV file (one row per snapshot)
+        export_npz(file_name): writes all snapshots to a numpy NPZ file (requires numpy)
+    """
+
+    def __init__(self, form, keys=None, capacity=1024):
+        if keys is None:
+            keys = [key for key, widget in form.widgets.items() if isinstance(widget, (LabelEntry, LabelEntryUnit))]
+        self.form = form
+        self.keys = tuple(keys)
+        self.unit_keys = tuple(key for key in self.keys if isinstance(form.widgets[key], LabelEntryUnit))
+        self.units = []
+        self._unit_codes = {}
+        self.capacity = max(int(capacity), 1)
+        self.count = 0
+        self._values = {key: array('d', bytes(8 * self.capacity)) for key in self.keys}
+        self._unit_values = {key: array('H', bytes(2 * self.capacity)) for key in self.unit_keys}
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """ Doubles the capacity of all columns """
+        for columns in (self._values, self._unit_values):
+            for column in columns.values():
+                column.extend(array(column.typecode, bytes(column.itemsize * self.capacity)))
+        self.capacity *= 2
+
+    def _unit_code(self, unit):
+        code = self._unit_codes.get(unit)
+        if code is None:
+            code = self._unit_codes[unit] = len(self.units)
+            self.units.append(unit)
+        return code
+
+    def record(self):
+        """ Records the current values of the form, returns the index of the snapshot """
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        values = self.form.values
+        nan = float('nan')
+        for key in self.keys:
+            # Keys removed from the form are recorded as NaN (with no unit)
+            value = values.get(key, '')
+            if key in self._unit_values:
+                value, unit = value if value != '' else ('', '')
+                self._unit_values[key][row] = self._unit_code(unit)
+            try:
+                self._values[key][row] = float(value)
+            except (ValueError, TypeError):
+                self._values[key][row] = nan
+        self.count += 1
+        return row
+
+    def column(self, key):
+        try:
+            import numpy as np
+        except ImportError:
+            return self._values[key][:self.count]
+        return np.frombuffer(self._values[key], dtype=float, count=self.count).copy()
+
+    def unit_column(self, key):
+        units = self.units
+        return [units[code] for code in self._unit_values[key][:self.count]]
+
+    def clear(self):
+        self.count = 0
+        self.units = []
+        self._unit_codes = {}
+
+    def export_csv(self, file_name):
+        """ Writes one row per snapshot, with a unit column after each LabelEntryUnit key """
+        header = []
+        columns = []
+        for key in self.keys:
+            header.append(key)
+            columns.append(['' if value != value else repr(value) for value in self._values[key][:self.count]])
+            if key in self._unit_values:
+                header.append(f'{key} [unit]')
+                columns.append(self.unit_column(key))
+        with open(file_name, 'w', newline='', encoding='utf-8') as file_object:
+            writer = csv.writer(file_object)
+            writer.writerow(header)
+            writer.writerows(zip(*columns))
+
+    def export_npz(self, file_name):
+        """
+        Writes each key as a float array and the units of each LabelEntryUnit key as '<key> [unit]', an array of codes
+        into the 'units' array. Keys whose array names would clash with another array are not accepted.
+        """
+        import numpy as np
+        arrays = {'units': np.array(self.units, dtype=str)}
+
+        def add(name, data):
+            if name in arrays:
+                raise Exception(f'Key {name} conflicts with another array of the NPZ file.')
+            arrays[name] = data
+
+        for key in self.keys:
+            add(str(key), np.frombuffer(self._values[key], dtype=float, count=self.count))
+            if key in self._unit_values:
+                add(f'{key} [unit]', np.frombuffer(self._unit_values[key], dtype=np.uint16, count=self.count))
+        np.savez(file_name, **arrays)
 
-                    self.set_unit('°F', update_last_unit=False)
-                    self.set_entry(new_value, update_last_value=False)
-                else:
-                    if not str(last_value):
-                        new_value = ''
-                    else:
-                        new_value = 5 * (float(last_value) - 32) / 9
-                    self.set_unit('°C', update_last_unit=False)
-                    self.set_entry(new_value, update_last_value=False)
 
+class FormModel:
+    """
+    Keeps the values of many compound widgets, each under a key, on a Python dictionary.
+    The dictionary is updated by the variable traces of the widgets, so reading the whole form is a dictionary copy,
+    without reading each Tcl variable.
+    LabelText widgets have no variable: they are read when the form is read (their modified flag is not touched).
+    Values are the same as returned by each widget 'get' method, (value, unit) for LabelEntryUnit.
+    Parameters:
+        widgets: dictionary with the widgets to be registered under each key
+    Methods for the user:
+        register(key, widget): adds a widget to the form under the given key
+        unregister(*keys): removes widgets from the form
+        get(key): current value of a widget
+        set(key, value): sets a value to a widget
+        to_dict(): dictionary with the current values of all widgets
+        from_dict(values): sets the values of the widgets of the given keys
+        start_snapshots(keys=None, capacity=1024): starts a new column store for the values (see FormSnapshots)
+        snapshot(): records the current values on the column store, returns the index of the snapshot
+    """
+
+    widget_types = (LabelEntry, LabelCombo, LabelSpinbox, LabelEntryUnit, LabelText)
+
+    def __init__(self, widgets=None):
+        self.widgets = {}
+        self.values = {}
+        self._bindings = {}
+        self._text_keys = set()
+        self.snapshots = None
+        if widgets:
+            for key, widget in widgets.items():
+                self.register(key, widget)
+
+    def register(self, key, widget):
+        if not isinstance(widget, self.widget_types):
+            raise Exception('Only LabelEntry, LabelCombo, LabelSpinbox, LabelEntryUnit and LabelText widgets '
+                            'may be registered on a FormModel.')
+        if key in self.widgets:
+            self.unregister(key)
+
+        def update(*args):
+            self.values[key] = widget.get()
+
+        if isinstance(widget, LabelText):
+            self._text_keys.add(key)
+            bindings = []
+        elif isinstance(widget, LabelEntryUnit):
+            bindings = [(widget.entry_variable, widget.entry_variable.trace_add('write', update)),
+                        (widget.combobox_variable, widget.combobox_variable.trace_add('write', update))]
         else:
-            if new_unit == last_unit:
-                self.set_entry(last_value)
-            else:
-                old_index = self.unit_combo.values.index(last_unit)
-                new_index = self.unit_combo.values.index(new_unit)
-                if not str(last_value):
-                    new_value = ''
-                else:
-                    # Convert from old index to index 1
-                    intermediary_value = float(last_value) * self.unit_combo.conversion_values[old_index]
+            bindings = [(widget.variable, widget.variable.trace_add('write', update))]
+
+        self.widgets[key] = widget
+        self._bindings[key] = bindings
+        update()
+
+    def unregister(self, *keys):
+        for key in keys:
+            if key not in self.widgets:
+                continue
+            for variable, name in self._bindings.pop(key):
+                variable.trace_remove('write', name)
+            self._text_keys.discard(key)
+            del self.widgets[key]
+            del self.values[key]
+
+    def _read_texts(self, keys):
+        """ Reads the current value of the LabelText widgets """
+        for key in keys:
+            self.values[key] = self.widgets[key].get()
+
+    def get(self, key):
+        if key in self._text_keys:
+            self._read_texts((key,))
+        return self.values[key]
+
+    def set(self, key, value):
+        widget = self.widgets[key]
+        if isinstance(widget, LabelEntryUnit) and isinstance(value, (tuple, list)):
+            widget.set(*value)
+        else:
+            widget.set(value)
+
+    def to_dict(self):
+        self._read_texts(self._text_keys)
+        return dict(self.values)
 
-                    # Convert from index 1 to new index
-                    new_value = intermediary_value / self.unit_combo.conversion_values[new_index]
+    def from_dict(self, values):
+        """ Sets the values of the given keys, with a single change notification per traced widget """
+        if not self.widgets:
+            return
+        with batch_updates(next(iter(self.widgets.values()))):
+            for key, value in values.items():
+                if key in self.widgets:
+                    self.set(key, value)
+
+    def start_snapshots(self, keys=None, capacity=1024):
+        self.snapshots = FormSnapshots(self, keys, capacity)
+        return self.snapshots
 
-                self.set_unit(new_unit, update_last_unit=False)
-                self.set_entry(new_value, update_last_value=False)
+    def snapshot(self):
+        if self.snapshots is None:
+            self.start_snapshots()
+        return self.snapshots.record()
 
 
 class LabelEntryButton(LabelCompoundWidget):
@@ -1537,6 +1871,8 @@ class LabelEntryButton(LabelCompoundWidget):
         entry_numeric: whether the entry accepts only numbers
         entry_width: entry width in number of characters
         entry_method: method to associate with the entry events
+        notify_delay_ms: with trace_variable, time (ms) to gather the changes before calling entry_method
+                         (None calls it once when idle)
         entry_max_char: maximum number of characters in the entry field
         button_text: string to be shown on the button
         button_width: width of the button in characters
@@ -1554,7 +1890,7 @@ class LabelEntryButton(LabelCompoundWidget):
     def __init__(self, parent, label_text=None, label_anchor='e', label_width=None,
                  label_justify=None, label_font=None, sided=True,
                  entry_value='', entry_numeric=False, entry_width=None, entry_max_char=None,
-                 entry_method=None, precision=2, trace_variable=False,
+                 entry_method=None, precision=2, trace_variable=False, notify_delay_ms=None,
                  button_text='', button_width=None, button_method=None,
                  button_style=None, style=None, **kwargs):
 
@@ -1570,6 +1906,7 @@ class LabelEntryButton(LabelCompoundWidget):
             self.entry_method = None
         self.precision = precision
         self.trace_variable = trace_variable
+        self.notify_delay_ms = notify_delay_ms
         if button_method and callable(button_method):
             self.button_method = button_method
         if not button_style:
@@ -1586,10 +1923,10 @@ class LabelEntryButton(LabelCompoundWidget):
         # Entry validation for numbers and max char
         if True:
             if self.precision == 0:
-                validate_numbers = self.register(int_only)
+                validate_numbers = register_validator(self, get_validator('int', entry_max_char))
             else:
-                validate_numbers = self.register(float_only)
-            validate_chars = self.register(max_chars)
+                validate_numbers = register_validator(self, get_validator('float', entry_max_char))
+            validate_chars = register_validator(self, get_validator('max_chars', entry_max_char))
 
         # Local frame (entry + button)
         if True:
@@ -1618,13 +1955,13 @@ class LabelEntryButton(LabelCompoundWidget):
             if entry_numeric:
                 if not isfloat(entry_value):
                     self.variable.set('')
-                self.entry.config(validate='all', validatecommand=(validate_numbers, '%d', '%P', '%S', entry_max_char))
+                self.entry.config(validate='key', validatecommand=(validate_numbers, '%d', '%P', '%S'))
 
             # Restrict max characters
             elif entry_max_char and not entry_numeric:
                 entry_value = str(entry_value[:entry_max_char])
                 self.variable.set(entry_value)
-                self.entry.config(validate='all', validatecommand=(validate_chars, '%d', '%P', entry_max_char))
+                self.entry.config(validate='key', validatecommand=(validate_chars, '%d', '%P'))
 
         # Button configuration
         if True:
@@ -1645,9 +1982,12 @@ class LabelEntryButton(LabelCompoundWidget):
     def _update_value(self, name, index, mode):
         """ Variable trace method. Calls the applicable method everytime the value changes """
 
-        if self.entry_method:
-            self.entry.event_generate("<Return>")
-            # to call the self.entry_method()
+        if self._trace_is_muted():
+            return
+        self._notify_change()
+
+    def _change_widget(self):
+        return self.entry
 
     def _adjust_value(self, event):
         """
@@ -1657,18 +1997,10 @@ class LabelEntryButton(LabelCompoundWidget):
         if self.entry_numeric:
             if isfloat(value):
                 value = float(value)
-                if self.trace_variable:
-                    self.variable.trace_remove('write', self.cb_name)
-                    self.variable.set(f'{value:.{self.precision}f}')
-                    self.cb_name = self.variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     self.variable.set(f'{value:.{self.precision}f}')
         else:
-            if self.trace_variable:
-                self.variable.trace_remove('write', self.cb_name)
-                self.variable.set(value)
-                self.cb_name = self.variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.variable.set(value)
 
         if self.entry_method:
@@ -1701,29 +2033,17 @@ class LabelEntryButton(LabelCompoundWidget):
             return
         if self.entry_numeric:
             if value == '':
-                if self.trace_variable:
-                    self.variable.trace_remove('write', self.cb_name)
-                    self.variable.set(value)
-                    self.cb_name = self.variable.trace_add("write", self._update_value)
-                else:
+                with self._muted_trace():
                     self.variable.set(value)
             elif isfloat(value):
                 value = float(value)
                 if self.precision == 0:
                     value = int(value)
-                    if self.trace_variable:
-                        self.variable.trace_remove('write', self.cb_name)
-                        self.variable.set(str(value))
-                        self.cb_name = self.variable.trace_add("write", self._update_value)
-                    else:
+                    with self._muted_trace():
                         self.variable.set(str(value))
 
                 else:
-                    if self.trace_variable:
-                        self.variable.trace_remove('write', self.cb_name)
-                        self.variable.set(f'{value:.{self.precision}f}')
-                        self.cb_name = self.variable.trace_add("write", self._update_value)
-                    else:
+                    with self._muted_trace():
                         self.variable.set(f'{value:.{self.precision}f}')
             else:
                 return
@@ -1731,11 +2051,7 @@ class LabelEntryButton(LabelCompoundWidget):
         else:
             if self.entry_max_chars:
                 value = str(value)[:self.entry_max_chars]
-            if self.trace_variable:
-                self.variable.trace_remove('write', self.cb_name)
-                self.variable.set(value)
-                self.cb_name = self.variable.trace_add("write", self._update_value)
-            else:
+            with self._muted_trace():
                 self.variable.set(value)
 
     def set_button_style(self, button_style):
@@ -1,5 +1,6 @@
 import ttkbootstrap as ttk
 from .SCRIPTS import *
+from .ICON_ATLAS import open_icon
 import os
 
 ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), 'IMAGES'))
@@ -61,7 +62,7 @@ class YesButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'yes.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20, maximize=True)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, maximize=True, master=self)
 
         if language == 'br':
             text = 'SIM\t'
@@ -78,7 +79,7 @@ class NoButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'no.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, master=self)
 
         if language == 'br':
             text = 'NÃO\t'
@@ -95,7 +96,7 @@ class OKButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'yes.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20, maximize=True)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, maximize=True, master=self)
 
         self.configure(text='OK\t', image=tk_image)
         self.image = tk_image
@@ -107,7 +108,7 @@ class CancelButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'no.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, master=self)
 
         if language == 'br':
             text = 'CANCELAR'
@@ -124,7 +125,7 @@ class ClearButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'clear.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20, maximize=True)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, maximize=True, master=self)
 
         if language == 'br':
             text = 'LIMPAR\t'
@@ -141,7 +142,7 @@ class SaveButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'save.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, master=self)
 
         if language == 'br':
             text = 'SALVAR\t'
@@ -158,7 +159,7 @@ class CalculateButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'calculate.png')
-        tk_image = open_image(file_name=image_path, size_x=20, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=20, size_y=20, master=self)
 
         if language == 'br':
             text = 'CALCULAR\t'
@@ -175,7 +176,7 @@ class HelpButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'help.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         self.configure(image=tk_image)
         self.image = tk_image
@@ -186,7 +187,7 @@ class BackButton(CompoundButton):
     def __init__(self, parent, *args, style='danger', language='en', width=15, **kwargs):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
         image_path = os.path.join(ROOT_DIR, 'back.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'VOLTAR\t\t'
@@ -202,7 +203,7 @@ class AddToReport(CompoundButton):
     def __init__(self, parent, *args, language='en', style='success', width=15,  **kwargs):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
         image_path = os.path.join(ROOT_DIR, 'add_to_form.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'ADICIONAR\t'
@@ -218,7 +219,7 @@ class EditReport(CompoundButton):
     def __init__(self, parent, *args, style='primary', language='en', width=15, **kwargs):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
         image_path = os.path.join(ROOT_DIR, 'edit_form.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'EDITAR\t\t'
@@ -235,7 +236,7 @@ class RemoveFromReport(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'remove_from_form.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'EXCLUIR\t\t'
@@ -252,7 +253,7 @@ class AddNewButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'add_new.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         self.configure(image=tk_image)
         self.image = tk_image
@@ -264,7 +265,7 @@ class EraseButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'trash_can.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         self.configure(image=tk_image)
         self.image = tk_image
@@ -276,7 +277,7 @@ class QuitButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'quit.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'SAIR\t\t'
@@ -293,7 +294,7 @@ class ClipBoardButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'copy_to_clipboard.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Copiar para àrea de transferência\t'
@@ -309,7 +310,7 @@ class NextButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'right_arrow.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Próximo\t\t'
@@ -326,7 +327,7 @@ class PreviousButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'left_arrow.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Anterior\t\t'
@@ -343,7 +344,7 @@ class UpButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'up_arrow.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Acima\t\t'
@@ -360,7 +361,7 @@ class DownButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'down_arrow.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Abaixo\t\t'
@@ -377,7 +378,7 @@ class SearchButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'search.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Procurar\t\t'
@@ -394,7 +395,7 @@ class HomeButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'home.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Início\t\t'
@@ -411,7 +412,7 @@ class MainMenuButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'burguer_menu.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Menu\t\t'
@@ -428,7 +429,7 @@ class AppsMenuButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'apps_menu.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Menu\t\t'
@@ -445,7 +446,7 @@ class ConfigurationButton(CompoundButton):
         super().__init__(parent, *args, style=style, language=language, width=width, **kwargs)
 
         image_path = os.path.join(ROOT_DIR, 'configuration.png')
-        tk_image = open_image(file_name=image_path, size_x=30, size_y=20)
+        tk_image = open_icon(file_name=image_path, size_x=30, size_y=20, master=self)
 
         if language == 'br':
             text = 'Configurações\t\t'
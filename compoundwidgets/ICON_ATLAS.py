@@ -0,0 +1,144 @@
+import tkinter as tk
+import json
+import os
+from .SCRIPTS import *
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), 'IMAGES'))
+ATLAS_IMAGE = os.path.join(ROOT_DIR, 'icon_atlas.png')
+ATLAS_INDEX = os.path.join(ROOT_DIR, 'icon_atlas.json')
+
+# Sizes (size_x, size_y, maximize) used by the custom buttons, pre-rendered for every icon
+ATLAS_SIZES = (
+    (20, 20, True),
+    (20, 20, False),
+    (30, 20, False),
+)
+
+# Width of the atlas image (icons are packed in rows)
+ATLAS_WIDTH = 512
+
+
+def atlas_entry(file_name, size_x, size_y, maximize):
+    """ Key of an icon on the atlas index """
+    return f'{os.path.basename(file_name)}|{size_x}|{size_y}|{int(bool(maximize))}'
+
+
+def build_atlas(image_dir=ROOT_DIR, sizes=ATLAS_SIZES, atlas_image=ATLAS_IMAGE, atlas_index=ATLAS_INDEX):
+    """
+    Pre-renders every PNG icon from 'image_dir' at the given sizes into a single atlas image.
+    The icons are resized exactly as 'open_image' does, so the atlas and the fallback give the same result.
+    The index maps each icon (name, size_x, size_y, maximize) to its rectangle (x, y, width, height) on the atlas.
+    """
+
+    from PIL import Image
+
+    # Neither the atlas being built nor the shipped atlas are icons
+    atlas_files = {os.path.realpath(atlas_image), os.path.realpath(ATLAS_IMAGE)}
+
+    icons = []
+    for name in sorted(os.listdir(image_dir)):
+        path = os.path.join(image_dir, name)
+        if not name.endswith('.png') or os.path.realpath(path) in atlas_files:
+            continue
+        with Image.open(path) as source:
+            for size_x, size_y, maximize in sizes:
+                icons.append((atlas_entry(name, size_x, size_y, maximize),
+                              resize_image(source, size_x, size_y, maximize)))
+
+    # Row packing, tallest icons first
+    icons.sort(key=lambda item: (-item[1].size[1], item[0]))
+    index = {}
+    x, y, row_height = 0, 0, 0
+    for key, image in icons:
+        width, height = image.size
+        if x + width > ATLAS_WIDTH:
+            x, y, row_height = 0, y + row_height, 0
+        index[key] = (x, y, width, height)
+        x += width
+        row_height = max(row_height, height)
+
+    atlas = Image.new('RGBA', (ATLAS_WIDTH, y + row_height), (0, 0, 0, 0))
+    for key, image in icons:
+        atlas.paste(image, index[key][:2])
+    atlas.save(atlas_image, optimize=True)
+
+    with open(atlas_index, 'w') as file_object:
+        json.dump({'image': os.path.basename(atlas_image), 'icons': index}, file_object, sort_keys=True)
+
+    return index
+
+
+class IconAtlas:
+    """
+    Loader for the pre-rendered icon atlas.
+    The atlas image is read once per interpreter by Tk itself (no PIL) and the icons are copied out of it.
+    Only icons from the atlas folder are looked up on it, other icons (or a missing atlas) fall back to
+    'open_cached_image'.
+    Parameters:
+        atlas_image: path to the atlas image
+        atlas_index: path to the atlas index
+    Methods for the user:
+        open_icon(file_name, size_x, size_y, maximize=False, master=None): returns the icon as a PhotoImage
+    """
+
+    def __init__(self, atlas_image=ATLAS_IMAGE, atlas_index=ATLAS_INDEX):
+        self.atlas_image = atlas_image
+        self.atlas_index = atlas_index
+        self._index = None
+
+    @property
+    def index(self):
+        """ Atlas index, read on the first use (empty if there is no atlas) """
+        if self._index is None:
+            try:
+                with open(self.atlas_index, 'r') as file_object:
+                    self._index = json.load(file_object)['icons']
+            except (OSError, ValueError, KeyError):
+                self._index = {}
+        return self._index
+
+    def _atlas(self, master):
+        """ Atlas image on the interpreter of 'master' """
+        master, key = image_key(self.atlas_image, 0, 0, master=master)
+        atlas = image_cache.get(key)
+        if atlas is None:
+            atlas = tk.PhotoImage(master=master, file=self.atlas_image)
+            image_cache.put(key, atlas, master)
+        return atlas
+
+    def open_icon(self, file_name, size_x, size_y, maximize=False, master=None):
+
+        rectangle = None
+        if os.path.dirname(os.path.realpath(file_name)) == os.path.dirname(os.path.realpath(self.atlas_image)):
+            rectangle = self.index.get(atlas_entry(file_name, size_x, size_y, maximize))
+        if rectangle is None:
+            return open_cached_image(file_name, size_x, size_y, maximize, master=master)
+
+        master, key = image_key(file_name, size_x, size_y, maximize, False, master)
+        tk_image = image_cache.get(key)
+        if tk_image is None:
+            try:
+                atlas = self._atlas(master)
+            except tk.TclError:
+                self._index = {}
+                return open_cached_image(file_name, size_x, size_y, maximize, master=master)
+            x, y, width, height = rectangle
+            tk_image = tk.PhotoImage(master=master, width=width, height=height)
+            tk_image.tk.call(tk_image, 'copy', atlas, '-from', x, y, x + width, y + height, '-to', 0, 0)
+            image_cache.put(key, tk_image, master)
+        return tk_image
+
+
+# Atlas shipped with the package
+icon_atlas = IconAtlas()
+
+
+def open_icon(file_name, size_x, size_y, maximize=False, master=None):
+    """ Opens an icon from the package atlas (or from its file, if not pre-rendered) """
+    return icon_atlas.open_icon(file_name, size_x, size_y, maximize, master)
+
+
+if __name__ == '__main__':
+    # Rebuilds the atlas: python -m compoundwidgets.ICON_ATLAS
+    atlas_index = build_atlas()
+    print(f'{len(atlas_index)} icons written to {ATLAS_IMAGE}')
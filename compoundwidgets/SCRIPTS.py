@@ -1,5 +1,24 @@
-from PIL import Image, ImageTk, ImageFilter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import tkinter
+import hashlib
+import importlib
 import json
+import os
+import struct
+from .UNITS import unit_registry
+
+# PIL modules once imported by this module: still available as attributes (SCRIPTS.Image, ...), imported on first use
+_pil_modules = ('Image', 'ImageTk', 'ImageFilter')
+
+
+def __getattr__(name):
+    if name in _pil_modules:
+        module = importlib.import_module(f'PIL.{name}')
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # Entry validation methods ---------------------------------------------------------------------------------------------
@@ -59,8 +78,113 @@ def max_chars(action, value, max_length):
     return True
 
 
+class EntryValidator:
+    """
+    Base of the shared entry validators.
+    A validator is built once for each configuration and shared by all widgets (see 'get_validator'), the maximum
+    length being kept on the validator instead of being passed as a string on every call.
+    Validators take the same arguments as the functions above: action (%d), new value (%P), inserted text (%S).
+    Parameters:
+        max_length: maximum number of characters (None for no limit)
+    """
+
+    def __init__(self, max_length=None):
+        self.max_length = max_length
+
+    def __call__(self, action, value, text='', *args):
+        if action != '1':
+            return True
+        return self.max_length is None or len(value) <= self.max_length
+
+
+class FloatValidator(EntryValidator):
+    """ Same result as 'float_only': only float related characters are accepted as input """
+
+    characters = frozenset('0123456789.-')
+
+    def __call__(self, action, value, text='', *args):
+        if action != '1':
+            return True
+        if self.max_length is not None and len(value) > self.max_length:
+            return False
+        if value == '.' and text == '.':
+            return False
+        if value == '-' and text == '-':
+            return True
+        if text not in self.characters:
+            return False
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+
+
+class IntValidator(EntryValidator):
+    """ Same result as 'int_only': only int related characters are accepted as input """
+
+    characters = frozenset('0123456789-')
+
+    def __call__(self, action, value, text='', *args):
+        if action != '1':
+            return True
+        if self.max_length is not None and len(value) > self.max_length:
+            return False
+        if value == '-' and text == '-':
+            return True
+        if text not in self.characters:
+            return False
+        try:
+            int(value)
+            return True
+        except ValueError:
+            return False
+
+
+# Validators already built, for each (kind, max_length)
+_validators = {}
+_validator_classes = {'float': FloatValidator, 'int': IntValidator, 'max_chars': EntryValidator}
+
+
+def get_validator(kind, max_length=None):
+    """
+    Returns the shared validator for the configuration.
+    kind: 'float', 'int' or 'max_chars'
+    max_length: maximum number of characters (None for no limit)
+    """
+
+    if max_length in (None, '', 'None'):
+        max_length = None
+    else:
+        max_length = int(max_length)
+
+    validator = _validators.get((kind, max_length))
+    if validator is None:
+        try:
+            validator_class = _validator_classes[kind]
+        except KeyError:
+            raise Exception(f'Validator {kind} not found.')
+        validator = _validators[(kind, max_length)] = validator_class(max_length)
+    return validator
+
+
+def register_validator(widget, validator):
+    """
+    Returns the Tcl command of the validator on the interpreter of the widget.
+    The command is registered only once on each root window and removed when the root is destroyed.
+    """
+
+    root = widget._root()
+    commands = root.__dict__.setdefault('_validator_commands', {})
+    command = commands.get(validator)
+    if command is None:
+        command = commands[validator] = root.register(validator)
+    return command
+
+
 # File methods ---------------------------------------------------------------------------------------------------------
-def open_image(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False) -> ImageTk:
+def open_image(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False,
+               master=None, disk_cache: bool = False) -> 'ImageTk.PhotoImage':
     """
     Function to open an image file and to adjust its dimensions as specified
 
@@ -70,31 +194,447 @@ def open_image(file_name: str, size_x: int, size_y: int, maximize: bool = False,
             maximize -  if True enlarges the image to fit the dimensions,
                         else if reduces the image to fit the dimensions
             blur - whether to apply a blur filter to the image
+            master - widget on the interpreter where the image will be used (default root if not given)
+            disk_cache - whether the final image is kept on 'image_disk_cache' for the next runs
 
     Return: tk_image - ImageTK to be inserted on a widget
     """
 
-    image_final_width = size_x
-    image_final_height = size_y
-    image_file_name = file_name
+    from PIL import ImageTk
+
+    final_pil_image = load_image(file_name, size_x, size_y, maximize, blur, disk_cache)
+    tk_image = ImageTk.PhotoImage(final_pil_image, master=master)
+
+    return tk_image
+
+
+def load_image(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False,
+               disk_cache: bool = False) -> 'Image.Image':
+    """
+    Opens an image file and adjusts it as specified by 'open_image' (returns an RGBA PIL image).
+    Does not use Tk, so it may run on a worker thread.
+    """
+
+    from PIL import Image
+
+    if disk_cache:
+        final_pil_image = image_disk_cache.get(file_name, size_x, size_y, maximize, blur)
+        if final_pil_image is not None:
+            return final_pil_image
+
+    with Image.open(file_name) as pil_image:
+        final_pil_image = resize_image(pil_image, size_x, size_y, maximize, blur)
+
+    if disk_cache:
+        image_disk_cache.put(file_name, size_x, size_y, maximize, blur, final_pil_image)
+    return final_pil_image
+
+
+class ImageDiskCache:
+    """
+    On disk cache of the final (resized and blurred) images, so the next runs only need to read the raw pixels.
+    Entries are keyed by the source path, its modification time and size and the 'open_image' parameters.
+    Each entry holds a small header (width, height) followed by the RGBA pixels.
+    When the cache grows beyond 'max_bytes', the least recently used entries are removed.
+    Parameters:
+        directory: cache folder (default: $XDG_CACHE_HOME/compoundwidgets or ~/.cache/compoundwidgets)
+        max_bytes: maximum size of the cache
+    Methods for the user:
+        get(file_name, size_x, size_y, maximize, blur): cached RGBA PIL image (None if not cached)
+        put(file_name, size_x, size_y, maximize, blur, pil_image): adds an image to the cache
+        size(): current size of the cache (bytes)
+        clear(): removes all entries from the cache
+    """
+
+    magic = b'CWRGBA1'
+    header = struct.Struct('>7sII')
+    extension = '.rgba'
+
+    def __init__(self, directory=None, max_bytes=64 * 1024 * 1024):
+        if directory is None:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            directory = os.path.join(base, 'compoundwidgets')
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, file_name, size_x, size_y, maximize, blur):
+        """ Path of the entry for the given source and parameters (None if the source cannot be read) """
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return None
+        key = f'{os.path.realpath(file_name)}|{stat.st_mtime_ns}|{stat.st_size}|{size_x}|{size_y}|' \
+              f'{bool(maximize)}|{bool(blur)}|{REDUCE_ON_LOAD_PIXELS}'
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + self.extension)
+
+    def get(self, file_name, size_x, size_y, maximize=False, blur=False):
+
+        from PIL import Image
+
+        path = self._path(file_name, size_x, size_y, maximize, blur)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as file_object:
+                data = file_object.read()
+            os.utime(path)
+        except OSError:
+            return None
+
+        if len(data) < self.header.size:
+            return None
+        magic, width, height = self.header.unpack_from(data)
+        if magic != self.magic or len(data) != self.header.size + 4 * width * height:
+            return None
+        return Image.frombytes('RGBA', (width, height), data[self.header.size:])
+
+    def put(self, file_name, size_x, size_y, maximize, blur, pil_image):
+
+        path = self._path(file_name, size_x, size_y, maximize, blur)
+        if path is None:
+            return
+        pil_image = pil_image.convert('RGBA')
+        data = self.header.pack(self.magic, *pil_image.size) + pil_image.tobytes()
+        if len(data) > self.max_bytes:
+            return
+
+        temporary_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary_path, 'wb') as file_object:
+                file_object.write(data)
+            os.replace(temporary_path, path)
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def _entries(self):
+        """ Cache entries as (last use, size, path) """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(self.extension):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """ Removes the least recently used entries until the cache fits 'max_bytes' """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def size(self):
+        """ Current size of the cache (bytes) """
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# Disk cache used by 'open_image(..., disk_cache=True)'
+image_disk_cache = ImageDiskCache()
+
+
+# Source images above this number of pixels are reduced on load by 'resize_image'
+REDUCE_ON_LOAD_PIXELS = 1_000_000
+
+# Worker threads for 'open_image_async', created on the first use
+image_executor = None
+image_executor_lock = threading.Lock()
+
+
+def get_image_executor() -> ThreadPoolExecutor:
+    """ Thread pool shared by all 'open_image_async' calls """
+    global image_executor
+    with image_executor_lock:
+        if image_executor is None:
+            image_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                thread_name_prefix='compoundwidgets-image')
+        return image_executor
+
+
+def open_image_async(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False,
+                     callback=None, master=None, placeholder: bool = False, poll_ms: int = 20,
+                     disk_cache: bool = False, error_callback=None):
+    """
+    Same as 'open_image', but the image is decoded, resized and blurred on a worker thread.
+    The PhotoImage is created on the Tk thread (the only one allowed to use Tk) once the image is ready.
+
+    Input:  file_name, size_x, size_y, maximize, blur - same as 'open_image'
+            callback - function called on the Tk thread with the PhotoImage when it is ready
+            master - widget on the interpreter where the image will be used (default root if not given)
+            placeholder - whether a transparent image of the final size is returned right away
+                          and filled in when the image is ready (the same PhotoImage is given to the callback)
+            poll_ms - interval (ms) between checks for the worker result
+            disk_cache - whether the final image is kept on 'image_disk_cache' for the next runs
+            error_callback - function called on the Tk thread with the exception if the image cannot be loaded
+                             (if not given, the exception is reported as any Tk callback exception)
+
+    Return: tk_image - the placeholder PhotoImage (None if no placeholder was requested)
+    """
+
+    from PIL import Image, ImageTk
+
+    if master is None:
+        master = tkinter._default_root
+
+    tk_image = None
+    if placeholder:
+        with Image.open(file_name) as pil_image:
+            width, height = final_size(*pil_image.size, size_x, size_y, maximize)
+        tk_image = ImageTk.PhotoImage('RGBA', (width, height), master=master)
+
+    future = get_image_executor().submit(load_image, file_name, size_x, size_y, maximize, blur, disk_cache)
+
+    def check():
+        if not future.done():
+            try:
+                master.after(poll_ms, check)
+            except tkinter.TclError:
+                future.cancel()
+            return
+
+        try:
+            final_pil_image = future.result()
+            if tk_image is None:
+                result = ImageTk.PhotoImage(final_pil_image, master=master)
+            else:
+                tk_image.paste(final_pil_image)
+                result = tk_image
+        except Exception as error:
+            if error_callback:
+                error_callback(error)
+            else:
+                master._root().report_callback_exception(type(error), error, error.__traceback__)
+            return
+        if callback:
+            callback(result)
+
+    master.after(poll_ms, check)
+    return tk_image
+
+
+def resize_image(pil_image, size_x: int, size_y: int, maximize: bool = False, blur: bool = False) -> 'Image.Image':
+    """
+    Adjusts the dimensions of a PIL image as specified by 'open_image' (returns an RGBA PIL image)
+    Large images are reduced on load: JPEG files are decoded straight to a smaller scale (draft mode) and the
+    resampling is done in two steps (a fast integer reduction followed by the final filter).
+    The blur hides the resampling details, so a cheaper filter is used for blurred images.
+    """
+
+    from PIL import Image, ImageFilter
 
-    pil_image = Image.open(image_file_name)
     w, h = pil_image.size
 
-    if maximize:
-        final_scale = min(h / image_final_height, w / image_final_width)
-    else:
-        final_scale = max(h / image_final_height, w / image_final_width)
+    width_final, height_final = final_size(w, h, size_x, size_y, maximize)
+    reducing_gap = None
+    if w * h > REDUCE_ON_LOAD_PIXELS and width_final < w:
+        pil_image.draft(None, (width_final, height_final))
+        reducing_gap = 3.0
 
-    width_final = int(w / final_scale)
-    height_final = int(h / final_scale)
-    final_pil_image = pil_image.resize((width_final, height_final), Image.LANCZOS)
+    resample = Image.BILINEAR if blur else Image.LANCZOS
+    final_pil_image = pil_image.resize((width_final, height_final), resample, reducing_gap=reducing_gap)
     final_pil_image = final_pil_image.convert('RGBA')
     if blur:
         final_pil_image = final_pil_image.filter(ImageFilter.BoxBlur(5))
 
-    tk_image = ImageTk.PhotoImage(final_pil_image)
+    return final_pil_image
+
+
+def final_size(width: int, height: int, size_x: int, size_y: int, maximize: bool = False) -> tuple:
+    """ Final dimensions of an image of the given dimensions, adjusted as specified by 'open_image' """
+
+    if maximize:
+        final_scale = min(height / size_y, width / size_x)
+    else:
+        final_scale = max(height / size_y, width / size_x)
+
+    return int(width / final_scale), int(height / final_scale)
+
+
+def png_size(file_name: str):
+    """ Dimensions (width, height) of a PNG file, read from its header (None if not a PNG file) """
+
+    try:
+        with open(file_name, 'rb') as file_object:
+            header = file_object.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n' or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def open_native_image(file_name: str, size_x: int, size_y: int, maximize: bool = False,
+                      master=None) -> 'tkinter.PhotoImage':
+    """
+    Opens a PNG image with Tk itself (no PIL), when its dimensions can be adjusted as specified by 'open_image'
+    by an integer ratio (Tk 'zoom' or 'subsample', which do not interpolate).
+
+    Input:  file_name, size_x, size_y, maximize - same as 'open_image'
+            master - widget on the interpreter where the image will be used (default root if not given)
 
+    Return: tk_image - PhotoImage, or None if the image cannot be opened this way
+    """
+
+    if tkinter.TkVersion < 8.6:
+        return None
+    size = png_size(file_name)
+    if not size:
+        return None
+
+    width, height = size
+    width_final, height_final = final_size(width, height, size_x, size_y, maximize)
+    if (width_final, height_final) == (width, height):
+        return tkinter.PhotoImage(master=master, file=file_name)
+
+    if width_final > width:
+        ratio = width_final // width
+        if (width * ratio, height * ratio) == (width_final, height_final):
+            return tkinter.PhotoImage(master=master, file=file_name).zoom(ratio)
+    elif width_final:
+        ratio = width // width_final
+        if (width_final * ratio, height_final * ratio) == (width, height):
+            return tkinter.PhotoImage(master=master, file=file_name).subsample(ratio)
+    return None
+
+
+class ImageCache:
+    """
+    Least recently used cache of the images created by 'open_image'.
+    Images are kept per Tk interpreter, since a PhotoImage can only be used on the interpreter that created it.
+    The images of an interpreter are removed when its root window is destroyed.
+    Parameters:
+        max_size: maximum number of images kept on the cache
+    Methods for the user:
+        get(key): cached image (None if not cached)
+        put(key, image, master=None): adds an image (used on the interpreter of the master widget) to the cache
+        stats(): dictionary with the hits, misses and current size of the cache
+        clear(master=None): removes the images of the master widget interpreter (all images if not given)
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._watched = set()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image, master=None):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_size:
+                self._images.popitem(last=False)
+        if master is not None:
+            self._watch(master)
+
+    def _watch(self, master):
+        """ Removes the images of the master interpreter when its root window is destroyed """
+
+        root = master._root()
+        with self._lock:
+            if root.tk in self._watched:
+                return
+            self._watched.add(root.tk)
+
+        def purge(event):
+            if event.widget is root:
+                self.clear(root)
+        root.bind('<Destroy>', purge, add='+')
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._images), 'max_size': self.max_size}
+
+    def clear(self, master=None):
+        with self._lock:
+            if master is None:
+                self._images.clear()
+                self._watched.clear()
+                self.hits = 0
+                self.misses = 0
+                return
+            interpreter = master.tk
+            for key in [key for key in self._images if key[-1] is interpreter]:
+                del self._images[key]
+            self._watched.discard(interpreter)
+
+    def __len__(self):
+        return len(self._images)
+
+
+# Cache shared by all widgets of the process
+image_cache = ImageCache()
+
+
+def image_key(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False, master=None):
+    """ Returns the master widget (default root if not given) and the 'image_cache' key for an image """
+    if master is None:
+        master = tkinter._default_root
+    interpreter = master.tk if master is not None else None
+    return master, (os.path.realpath(file_name), size_x, size_y, maximize, blur, interpreter)
+
+
+def open_cached_image(file_name: str, size_x: int, size_y: int, maximize: bool = False, blur: bool = False,
+                      master=None, disk_cache: bool = False) -> 'tkinter.PhotoImage':
+    """
+    Same as 'open_image', but the image is only created once per interpreter and then shared through 'image_cache'.
+    The image shall not be changed by the caller, since it may be in use by other widgets.
+    Images without blur are opened by Tk itself when possible (see 'open_native_image'), otherwise with PIL.
+
+    Input:  file_name, size_x, size_y, maximize, blur, disk_cache - same as 'open_image'
+            master - widget on the interpreter where the image will be used (default root if not given)
+
+    Return: tk_image - ImageTK to be inserted on a widget
+    """
+
+    master, key = image_key(file_name, size_x, size_y, maximize, blur, master)
+    tk_image = image_cache.get(key)
+    if tk_image is None:
+        if not blur:
+            try:
+                tk_image = open_native_image(file_name, size_x, size_y, maximize, master=master)
+            except tkinter.TclError:
+                tk_image = None
+        if tk_image is None:
+            tk_image = open_image(file_name, size_x, size_y, maximize, blur, master=master, disk_cache=disk_cache)
+        image_cache.put(key, tk_image, master)
     return tk_image
 
 
@@ -328,12 +868,12 @@ def convert_temperature(f_temperature=None, c_temperature=None):
     if f_temperature is not None:
         if isinstance(f_temperature, tuple):
             f_temperature = f_temperature[0]
-        return round(5 * (f_temperature - 32) / 9, 3), '°C'
+        return round(unit_registry.convert(f_temperature, '°F', '°C'), 3), '°C'
 
     if c_temperature is not None:
         if isinstance(c_temperature, tuple):
             c_temperature = c_temperature[0]
-        return round(9 * c_temperature / 5 + 32, 3), '°F'
+        return round(unit_registry.convert(c_temperature, '°C', '°F'), 3), '°F'
 
 
 def convert_stress(ksi_stress=None, mpa_stress=None):
@@ -342,12 +882,12 @@ def convert_stress(ksi_stress=None, mpa_stress=None):
     if ksi_stress is not None:
         if isinstance(ksi_stress, tuple):
             ksi_stress = ksi_stress[0]
-        return round(ksi_stress * 6.894757, 3), 'MPa'
+        return round(unit_registry.convert(ksi_stress, 'ksi', 'MPa'), 3), 'MPa'
 
     if mpa_stress is not None:
         if isinstance(mpa_stress, tuple):
             mpa_stress = mpa_stress[0]
-        return round(mpa_stress / 6.894757, 3), 'ksi'
+        return round(unit_registry.convert(mpa_stress, 'MPa', 'ksi'), 3), 'ksi'
 
 
 def convert_pressure(psi_pressure=None, kpa_pressure=None):
@@ -356,12 +896,12 @@ def convert_pressure(psi_pressure=None, kpa_pressure=None):
     if psi_pressure is not None:
         if isinstance(psi_pressure, tuple):
             psi_pressure = psi_pressure[0]
-        return round(psi_pressure * 6.894757, 3), 'kPa'
+        return round(unit_registry.convert(psi_pressure, 'psi', 'kPa'), 3), 'kPa'
 
     if kpa_pressure is not None:
         if isinstance(kpa_pressure, tuple):
             kpa_pressure = kpa_pressure[0]
-        return round(kpa_pressure / 6.894757, 3), 'psi'
+        return round(unit_registry.convert(kpa_pressure, 'kPa', 'psi'), 3), 'psi'
 
 
 def convert_length(in_length=None, mm_length=None):
@@ -370,9 +910,9 @@ def convert_length(in_length=None, mm_length=None):
     if in_length is not None:
         if isinstance(in_length, tuple):
             in_length = in_length[0]
-        return round(in_length * 25.4, 3), 'mm'
+        return round(unit_registry.convert(in_length, 'in', 'mm'), 3), 'mm'
 
     if mm_length is not None:
         if isinstance(mm_length, tuple):
             mm_length = mm_length[0]
-        return round(mm_length / 25.4, 3), 'in'
+        return round(unit_registry.convert(mm_length, 'mm', 'in'), 3), 'in'
@@ -0,0 +1,164 @@
+# Units of each quantity.
+# Each unit is given as (name, factor, offset) to the first unit of the quantity (its base unit):
+#       value[base] = value[unit] * factor + offset
+# 'metric' and 'imperial' are the units used when a widget is converted to either system.
+quantity_units = {
+    'none': {
+        'units': (('-', 1, 0),),
+        'metric': '-', 'imperial': '-'},
+    'temperature': {
+        'units': (('°C', 1, 0), ('°F', 5 / 9, -32 * 5 / 9)),
+        'metric': '°C', 'imperial': '°F'},
+    'temperature rate': {
+        'units': (('°C/s', 1, 0), ('°C/min', 1 / 60, 0), ('°C/hour', 1 / 3600, 0),
+                  ('°F/s', 5 / 9, 0), ('°F/min', 5 / 9 / 60, 0), ('°F/hour', 5 / 9 / 3600, 0)),
+        'metric': '°C/s', 'imperial': '°F/hour'},
+    'length': {
+        'units': (('mm', 1, 0), ('cm', 10, 0), ('m', 1000, 0), ('in', 25.4, 0)),
+        'metric': 'mm', 'imperial': 'in'},
+    'time': {
+        'units': (('s', 1, 0), ('min', 60, 0), ('hour', 3600, 0), ('day', 86400, 0), ('year', 3.1536e7, 0)),
+        'metric': 's', 'imperial': 's'},
+    'area': {
+        'units': (('mm²', 1, 0), ('cm²', 100, 0), ('m²', 1000000, 0), ('in²', 645.16, 0)),
+        'metric': 'mm²', 'imperial': 'in²'},
+    'pressure': {
+        'units': (('kPa', 1, 0), ('bar', 100, 0), ('kgf/cm²', 98.0665, 0), ('MPa', 1000, 0),
+                  ('atmosphere', 101.325, 0), ('ksi', 6894.757, 0), ('psi', 6.894757, 0)),
+        'metric': 'kPa', 'imperial': 'psi'},
+    'stress': {
+        'units': (('MPa', 1, 0), ('GPa', 1000, 0), ('x10³ ksi', 6894.757, 0), ('psi', 0.006894757, 0),
+                  ('ksi', 6.894757, 0)),
+        'metric': 'MPa', 'imperial': 'ksi'},
+    'force': {
+        'units': (('N', 1, 0), ('kN', 1000, 0), ('kgf', 9.80665, 0), ('lbf', 4.448222, 0)),
+        'metric': 'N', 'imperial': 'lbf'},
+    'moment': {
+        'units': (('N.m', 1, 0), ('kN.m', 1000, 0), ('kgf.m', 9.80665, 0), ('lbf.ft', 1.35582, 0)),
+        'metric': 'N.m', 'imperial': 'lbf.ft'},
+    'energy': {
+        'units': (('joule', 1, 0), ('ft-lbf', 1.355818, 0)),
+        'metric': 'joule', 'imperial': 'ft-lbf'},
+    'toughness': {
+        'units': (('MPa.√m', 1, 0), ('N/mm^(3/2)', 0.031621553, 0), ('ksi.√in', 1.0988015, 0)),
+        'metric': 'MPa.√m', 'imperial': 'ksi.√in'},
+    'j-integral': {
+        'units': (('joule/m²', 1, 0), ('ft-lbf/ft²', 14.5939, 0)),
+        'metric': 'joule/m²', 'imperial': 'ft-lbf/ft²'},
+    'thermal expansion': {
+        'units': (('10e-6/°C', 1, 0), ('10e-6/°F', 1.79856, 0)),
+        'metric': '10e-6/°C', 'imperial': '10e-6/°F'},
+}
+
+# Pairs of units used to convert any given data between the unit systems.
+#       imperial_unit_list[index] <=> metric_unit_list[index]
+# When a unit shows more than once, its first pair is used.
+# Temperature and time units are paired through their quantity (metric and imperial units).
+metric_unit_list = \
+    ('°C/s', '°C/min', '°C/hour',                           # TemperatureRateCombo
+     'mm', 'cm',  'm',                                      # LengthCombo
+     'mm²', 'cm²', 'm²',                                    # AreaCombo
+     'kPa', 'kPa', 'bar', 'kgf/cm²', 'MPa', 'atmosphere',   # PressureCombo
+     'GPa',                                                 # StressCombo
+     'N', 'kN', 'kgf',                                      # ForceCombo
+     'N.m', 'kN.m', 'kgf.m',                                # MomentCombo
+     '-',                                                   # NoUnitCombo
+     'N/mm^(3/2)', 'MPa.√m',                                # ToughnessCombo
+     'joule',                                               # EnergyCombo
+     'joule/m²',                                            # JIntegralCombo
+     '10e-6/°C',                                            # Thermal Expansion
+     )
+imperial_unit_list = \
+    ('°F/s', '°F/min', '°F/hour',
+     'in', 'in', 'in',
+     'in²', 'in²', 'in²',
+     'psi', 'ksi', 'ksi', 'ksi', 'ksi', 'psi',
+     'x10³ ksi',
+     'lbf', 'lbf', 'lbf',
+     'lbf.ft', 'lbf.ft', 'lbf.ft',
+     '-',
+     'ksi.√in', 'ksi.√in',
+     'ft-lbf',
+     'ft-lbf/ft²',
+     '10e-6/°F')
+
+
+class UnitRegistry:
+    """
+    Single source for the units and their conversions.
+    All conversions between units of the same quantity are computed once, so any conversion is a dictionary
+    lookup and a multiply-add.
+    Parameters:
+        quantities: dictionary with the units of each quantity (as 'quantity_units')
+        metric_units: metric unit of each pair of units
+        imperial_units: imperial unit of each pair of units
+    Methods for the user:
+        units(quantity): unit names of a quantity
+        conversion_values(quantity): factors from each unit of a quantity to its base unit
+        metric_unit(quantity) / imperial_unit(quantity): unit used for a quantity on each unit system
+        factor(from_unit, to_unit): (scale, offset) so that 'new value = value * scale + offset'
+        convert(value, from_unit, to_unit): converts a value
+        to_metric(unit) / to_imperial(unit): equivalent unit on the other unit system
+    """
+
+    def __init__(self, quantities, metric_units, imperial_units):
+
+        self.quantities = quantities
+        self.factors = {}
+        for quantity in quantities.values():
+            for unit_a, factor_a, offset_a in quantity['units']:
+                for unit_b, factor_b, offset_b in quantity['units']:
+                    self.factors[(unit_a, unit_b)] = (factor_a / factor_b, (offset_a - offset_b) / factor_b)
+
+        # Pairs of units, the unit itself if it already belongs to the unit system
+        self.metric_pairs = {}
+        self.imperial_pairs = {}
+        for metric_unit, imperial_unit in zip(metric_units, imperial_units):
+            self.metric_pairs.setdefault(metric_unit, metric_unit)
+            self.imperial_pairs.setdefault(imperial_unit, imperial_unit)
+        for metric_unit, imperial_unit in zip(metric_units, imperial_units):
+            self.metric_pairs.setdefault(imperial_unit, metric_unit)
+            self.imperial_pairs.setdefault(metric_unit, imperial_unit)
+        for quantity in quantities.values():
+            self.metric_pairs.setdefault(quantity['metric'], quantity['metric'])
+            self.imperial_pairs.setdefault(quantity['imperial'], quantity['imperial'])
+            self.metric_pairs.setdefault(quantity['imperial'], quantity['metric'])
+            self.imperial_pairs.setdefault(quantity['metric'], quantity['imperial'])
+
+    def units(self, quantity):
+        return tuple(unit for unit, _, _ in self.quantities[quantity]['units'])
+
+    def conversion_values(self, quantity):
+        return tuple(factor for _, factor, _ in self.quantities[quantity]['units'])
+
+    def metric_unit(self, quantity):
+        return self.quantities[quantity]['metric']
+
+    def imperial_unit(self, quantity):
+        return self.quantities[quantity]['imperial']
+
+    def factor(self, from_unit, to_unit):
+        try:
+            return self.factors[(from_unit, to_unit)]
+        except KeyError:
+            raise Exception(f'Conversion from {from_unit} to {to_unit} not found in current units dictionary.')
+
+    def convert(self, value, from_unit, to_unit):
+        scale, offset = self.factor(from_unit, to_unit)
+        return value * scale + offset
+
+    def to_metric(self, unit):
+        try:
+            return self.metric_pairs[unit]
+        except KeyError:
+            raise Exception(f'Unit {unit} not found in current units dictionary.')
+
+    def to_imperial(self, unit):
+        try:
+            return self.imperial_pairs[unit]
+        except KeyError:
+            raise Exception(f'Unit {unit} not found in current units dictionary.')
+
+
+# Registry used by the widgets and by the conversion methods
+unit_registry = UnitRegistry(quantity_units, metric_unit_list, imperial_unit_list)
@@ -5,68 +5,114 @@ __all__ = ['AUTOCOMPLETE_WIDGETS',
            'CUSTOM_BUTTONS',
            'CUSTOM_FRAMES',
            'MESSAGE_BOX_WIDGETS',
+           'ICON_ATLAS',
            'IMAGES',
-           'SCRIPTS']
-
-from .AUTOCOMPLETE_WIDGETS import AutocompleteEntryList
-from .AUTOCOMPLETE_WIDGETS import AutocompleteCombobox
-from .AUTOCOMPLETE_WIDGETS import AutocompleteLabelCombo
-
-from .COMPOUND_WIDGETS import LabelCombo
-from .COMPOUND_WIDGETS import LabelEntry
-from .COMPOUND_WIDGETS import LabelText
-from .COMPOUND_WIDGETS import LabelSpinbox
-from .COMPOUND_WIDGETS import LabelEntryUnit
-from .COMPOUND_WIDGETS import LabelEntryButton
-from .COMPOUND_WIDGETS import LabelComboButton
-
-from .CUSTOM_BUTTONS import YesButton
-from .CUSTOM_BUTTONS import NoButton
-from .CUSTOM_BUTTONS import OKButton
-from .CUSTOM_BUTTONS import CancelButton
-
-from .CUSTOM_BUTTONS import ClearButton
-from .CUSTOM_BUTTONS import SaveButton
-from .CUSTOM_BUTTONS import CalculateButton
-from .CUSTOM_BUTTONS import HelpButton
-
-from .CUSTOM_BUTTONS import BackButton
-from .CUSTOM_BUTTONS import AddToReport
-from .CUSTOM_BUTTONS import EditReport
-from .CUSTOM_BUTTONS import RemoveFromReport
-
-from .CUSTOM_BUTTONS import AddNewButton
-from .CUSTOM_BUTTONS import EraseButton
-from .CUSTOM_BUTTONS import QuitButton
-from .CUSTOM_BUTTONS import ClipBoardButton
-
-from .CUSTOM_BUTTONS import NextButton
-from .CUSTOM_BUTTONS import PreviousButton
-from .CUSTOM_BUTTONS import UpButton
-from .CUSTOM_BUTTONS import DownButton
-
-from .CUSTOM_BUTTONS import SearchButton
-from .CUSTOM_BUTTONS import HomeButton
-from .CUSTOM_BUTTONS import MainMenuButton
-from .CUSTOM_BUTTONS import AppsMenuButton
-from .CUSTOM_BUTTONS import ConfigurationButton
-
-from .CUSTOM_FRAMES import CollapsableFrame
-from .CUSTOM_FRAMES import ScrollableFrame
-from .CUSTOM_FRAMES import HCollapsableFrame
-from .CUSTOM_FRAMES import BorderFrame
-from .CUSTOM_FRAMES import LabelFrame
-
-from .LED_BUTTONS import CheckLedButton
-from .LED_BUTTONS import CheckSwitchLedButton
-from .LED_BUTTONS import RadioLedButton
-
-from .MESSAGE_BOX_WIDGETS import OkCancelBox
-from .MESSAGE_BOX_WIDGETS import YesNoBox
-from .MESSAGE_BOX_WIDGETS import WarningBox
-from .MESSAGE_BOX_WIDGETS import SuccessBox
-from .MESSAGE_BOX_WIDGETS import ProgressBar
-from .MESSAGE_BOX_WIDGETS import Tooltip
-from .MESSAGE_BOX_WIDGETS import TimedBox
-
-from .SCRIPTS import *
+           'SCRIPTS',
+           'UNITS']
+
+import importlib
+
+# Public names and the modules where they are defined: modules are only imported when one of their names is used
+_lazy_names = {
+    'AutocompleteEntryList': 'AUTOCOMPLETE_WIDGETS',
+    'AutocompleteCombobox': 'AUTOCOMPLETE_WIDGETS',
+    'AutocompleteLabelCombo': 'AUTOCOMPLETE_WIDGETS',
+    'Catalogue': 'AUTOCOMPLETE_WIDGETS',
+    'Matcher': 'AUTOCOMPLETE_WIDGETS',
+    'ValueProvider': 'AUTOCOMPLETE_WIDGETS',
+    'SQLiteProvider': 'AUTOCOMPLETE_WIDGETS',
+
+    'LabelCombo': 'COMPOUND_WIDGETS',
+    'LabelEntry': 'COMPOUND_WIDGETS',
+    'LabelText': 'COMPOUND_WIDGETS',
+    'LabelSpinbox': 'COMPOUND_WIDGETS',
+    'LabelEntryUnit': 'COMPOUND_WIDGETS',
+    'LabelEntryButton': 'COMPOUND_WIDGETS',
+    'LabelComboButton': 'COMPOUND_WIDGETS',
+    'UnitSystemController': 'COMPOUND_WIDGETS',
+    'FormModel': 'COMPOUND_WIDGETS',
+    'FormSnapshots': 'COMPOUND_WIDGETS',
+    'batch_updates': 'COMPOUND_WIDGETS',
+
+    'UnitRegistry': 'UNITS',
+    'unit_registry': 'UNITS',
+
+    'YesButton': 'CUSTOM_BUTTONS',
+    'NoButton': 'CUSTOM_BUTTONS',
+    'OKButton': 'CUSTOM_BUTTONS',
+    'CancelButton': 'CUSTOM_BUTTONS',
+
+    'ClearButton': 'CUSTOM_BUTTONS',
+    'SaveButton': 'CUSTOM_BUTTONS',
+    'CalculateButton': 'CUSTOM_BUTTONS',
+    'HelpButton': 'CUSTOM_BUTTONS',
+
+    'BackButton': 'CUSTOM_BUTTONS',
+    'AddToReport': 'CUSTOM_BUTTONS',
+    'EditReport': 'CUSTOM_BUTTONS',
+    'RemoveFromReport': 'CUSTOM_BUTTONS',
+
+    'AddNewButton': 'CUSTOM_BUTTONS',
+    'EraseButton': 'CUSTOM_BUTTONS',
+    'QuitButton': 'CUSTOM_BUTTONS',
+    'ClipBoardButton': 'CUSTOM_BUTTONS',
+
+    'NextButton': 'CUSTOM_BUTTONS',
+    'PreviousButton': 'CUSTOM_BUTTONS',
+    'UpButton': 'CUSTOM_BUTTONS',
+    'DownButton': 'CUSTOM_BUTTONS',
+
+    'SearchButton': 'CUSTOM_BUTTONS',
+    'HomeButton': 'CUSTOM_BUTTONS',
+    'MainMenuButton': 'CUSTOM_BUTTONS',
+    'AppsMenuButton': 'CUSTOM_BUTTONS',
+    'ConfigurationButton': 'CUSTOM_BUTTONS',
+
+    'CollapsableFrame': 'CUSTOM_FRAMES',
+    'ScrollableFrame': 'CUSTOM_FRAMES',
+    'HCollapsableFrame': 'CUSTOM_FRAMES',
+    'BorderFrame': 'CUSTOM_FRAMES',
+    'LabelFrame': 'CUSTOM_FRAMES',
+
+    'CheckLedButton': 'LED_BUTTONS',
+    'CheckSwitchLedButton': 'LED_BUTTONS',
+    'RadioLedButton': 'LED_BUTTONS',
+
+    'OkCancelBox': 'MESSAGE_BOX_WIDGETS',
+    'YesNoBox': 'MESSAGE_BOX_WIDGETS',
+    'WarningBox': 'MESSAGE_BOX_WIDGETS',
+    'SuccessBox': 'MESSAGE_BOX_WIDGETS',
+    'ProgressBar': 'MESSAGE_BOX_WIDGETS',
+    'Tooltip': 'MESSAGE_BOX_WIDGETS',
+    'TimedBox': 'MESSAGE_BOX_WIDGETS',
+}
+
+# Names from SCRIPTS are available at the package level as well
+_lazy_modules = ('SCRIPTS',)
+
+
+def __getattr__(name):
+    """ Imports the module of a public name on its first use """
+
+    if name in _lazy_names:
+        value = getattr(importlib.import_module(f'.{_lazy_names[name]}', __name__), name)
+
+    elif name in __all__ or name in _lazy_names.values():
+        value = importlib.import_module(f'.{name}', __name__)
+
+    else:
+        for module_name in _lazy_modules:
+            module = importlib.import_module(f'.{module_name}', __name__)
+            if not name.startswith('_') and hasattr(module, name):
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    scripts = importlib.import_module('.SCRIPTS', __name__)
+    return sorted(set(globals()) | set(_lazy_names) | {name for name in dir(scripts) if not name.startswith('_')})
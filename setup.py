@@ -13,7 +13,7 @@ setup(
     packages=['compoundwidgets', 'compoundwidgets.IMAGES'],
     install_requires=['ttkbootstrap', 'Pillow'],
     include_package_data=True,
-    package_data={"IMAGES": ["*.png"]},
+    package_data={"IMAGES": ["*.png", "*.json"]},
     classifiers=[
         'Programming Language :: Python :: 3',
     ],
@@ -0,0 +1,90 @@
+import os
+import sqlite3
+import tempfile
+import tkinter as tk
+import ttkbootstrap as ttk
+from ttkbootstrap import Style
+import compoundwidgets as cw
+
+
+def method_1(event=None):
+    print(widget_1.get())
+
+
+def method_2(event=None):
+    print(widget_2.get())
+
+
+root = tk.Tk()
+root.style = Style(theme='darkly')
+root.minsize(300, 200)
+root.rowconfigure(0, weight=1)
+root.columnconfigure(0, weight=1)
+root.columnconfigure(1, weight=1)
+
+materials = ('BOLT', 'NUT', 'WASHER', 'FLANGE', 'GASKET', 'VALVE')
+full_list = [f'PN-{i:06d} {materials[i % len(materials)]}' for i in range(300000)]
+
+# Catalogue shared by the comboboxes: the search index is built only once
+catalogue = cw.Catalogue(full_list)
+
+# Same values on a local SQLite file, searched a page at a time
+database = os.path.join(tempfile.gettempdir(), 'compoundwidgets_parts.db')
+if not os.path.exists(database):
+    connection = sqlite3.connect(database)
+    connection.execute('CREATE TABLE parts (name TEXT)')
+    connection.executemany('INSERT INTO parts VALUES (?)', ((value,) for value in full_list))
+    connection.commit()
+    connection.close()
+
+# First frame, filtering after the user stops typing
+frame = ttk.LabelFrame(root, text='Debounced filtering')
+frame.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+
+widget_1 = cw.AutocompleteEntryList(frame, label_text='Part number (300k values, 150 ms delay, 200 rows)',
+                                    label_anchor='w', list_method=method_1,
+                                    list_height=10, list_values=full_list,
+                                    filter_delay_ms=150, max_results=200)
+widget_1.grid(row=0, column=0, sticky='nsew', pady=(10, 0), padx=10)
+
+# Second frame, filtering on a worker thread
+frame = ttk.LabelFrame(root, text='Threaded search')
+frame.grid(row=0, column=1, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+
+widget_2 = cw.AutocompleteEntryList(frame, label_text='Part number (300k values, worker thread, virtual list)',
+                                    label_anchor='w', list_method=method_2,
+                                    list_height=10, list_values=full_list,
+                                    threaded_search=True, virtual_list=True)
+widget_2.grid(row=0, column=0, sticky='nsew', pady=(10, 0), padx=10)
+
+# Third frame, comboboxes
+frame = ttk.LabelFrame(root, text='Autocomplete comboboxes')
+frame.grid(row=1, column=0, columnspan=2, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+
+widget_3 = cw.AutocompleteLabelCombo(frame, label_text='Debounced:', combo_list=catalogue,
+                                     combo_width=30, filter_delay_ms=150)
+widget_3.grid(row=0, column=0, sticky='nsew', pady=5, padx=10)
+
+widget_4 = cw.AutocompleteCombobox(frame, values=catalogue, width=30, threaded_search=True)
+widget_4.grid(row=1, column=0, sticky='nsew', pady=5, padx=10)
+
+# Fourth frame, values from a provider
+frame = ttk.LabelFrame(root, text='Paged providers')
+frame.grid(row=2, column=0, columnspan=2, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+frame.columnconfigure(1, weight=1)
+
+widget_5 = cw.AutocompleteEntryList(frame, label_text='SQLite file (pages of 100 values)', label_anchor='w',
+                                    list_height=8, list_values=cw.SQLiteProvider(database, 'parts', 'name'),
+                                    threaded_search=True)
+widget_5.grid(row=0, column=0, sticky='nsew', pady=5, padx=10)
+
+widget_6 = cw.AutocompleteEntryList(frame, label_text='Generator (pages of 50 values)', label_anchor='w',
+                                    list_height=8, list_values=(f'ITEM-{i:07d}' for i in range(10 ** 6)),
+                                    page_size=50)
+widget_6.grid(row=0, column=1, sticky='nsew', pady=5, padx=10)
+
+root.mainloop()
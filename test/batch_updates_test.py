@@ -0,0 +1,85 @@
+import tkinter as tk
+import tkinter.ttk as ttk
+from ttkbootstrap import Style
+import compoundwidgets as cw
+import random
+
+root = tk.Tk()
+root.style = Style(theme='darkly')
+root.columnconfigure(0, weight=1)
+
+# Number of times each widget called its entry_method
+calls = {}
+
+
+def get_entry_method(name):
+    def entry_method(event=None):
+        calls[name] = calls.get(name, 0) + 1
+    return entry_method
+
+
+def show_calls():
+    print(' / '.join([f'{name}: {calls.get(name, 0)}' for name in names]))
+    calls.clear()
+
+
+def set_all():
+    # 'set' does not call the entry_method
+    for i in range(10):
+        for w in widget_list:
+            w.set(random.randint(1, 10))
+    root.after(200, show_calls)
+
+
+def set_all_in_batch():
+    # Within a batch, each changed widget calls its entry_method once, after the block
+    with cw.batch_updates(root):
+        for i in range(10):
+            for w in widget_list:
+                w.set(random.randint(1, 10))
+    root.after(200, show_calls)
+
+
+def write_all_in_batch():
+    # Direct writes to the widget variables are also gathered
+    with cw.batch_updates(root):
+        for i in range(10):
+            for w in entry_list:
+                w.variable.set(str(random.randint(1, 10)))
+            spinbox.variable.set(str(random.randint(1, 10)))
+            entry_unit.entry_variable.set(str(random.randint(1, 10)))
+    root.after(200, show_calls)
+
+
+frame = ttk.LabelFrame(root, text='Batch updates')
+frame.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+
+entry_list = []
+for i in range(3):
+    w = cw.LabelEntry(frame, label_text=f'Label Entry {i + 1}', label_width=12, entry_numeric=True,
+                      entry_method=get_entry_method(f'entry {i + 1}'), trace_variable=True)
+    w.grid(row=i, column=0, sticky='nsew', pady=2)
+    entry_list.append(w)
+
+spinbox = cw.LabelSpinbox(frame, label_text='Spinbox', label_width=12, entry_type='int', spin_start=0,
+                          spin_end=10, entry_method=get_entry_method('spinbox'), trace_variable=True)
+spinbox.grid(row=3, column=0, sticky='nsew', pady=2)
+
+entry_unit = cw.LabelEntryUnit(frame, label_text='Length', label_width=12, combobox_unit='length',
+                               entry_method=get_entry_method('length'), trace_variable=True)
+entry_unit.grid(row=4, column=0, sticky='nsew', pady=2)
+
+widget_list = entry_list + [spinbox, entry_unit]
+names = ('entry 1', 'entry 2', 'entry 3', 'spinbox', 'length')
+
+b1 = ttk.Button(frame, text='SET ALL', command=set_all)
+b1.grid(row=5, column=0, pady=2, sticky='ew', padx=2)
+
+b2 = ttk.Button(frame, text='SET ALL IN BATCH', command=set_all_in_batch)
+b2.grid(row=6, column=0, pady=2, sticky='ew', padx=2)
+
+b3 = ttk.Button(frame, text='WRITE VARIABLES IN BATCH', command=write_all_in_batch)
+b3.grid(row=7, column=0, pady=2, sticky='ew', padx=2)
+
+root.mainloop()
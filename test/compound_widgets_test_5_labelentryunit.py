@@ -62,6 +62,14 @@ def convert_entry_to_imperial():
         w.convert_to_imperial()
 
 
+def switch_all_to_metric():
+    controller.to_metric()
+
+
+def switch_all_to_imperial():
+    controller.to_imperial()
+
+
 def enable_self_conversion():
     for w in all_label_entry_units:
         if not w.combobox_unit_conversion:
@@ -99,6 +107,9 @@ for i, item in enumerate(unit_options):
     w.grid(row=i, column=0, sticky='nsew', pady=5, padx=10)
     all_label_entry_units.append(w)
 
+# Controller to switch the whole form in a single pass
+controller = cw.UnitSystemController(all_label_entry_units)
+
 b1 = ttk.Button(frame, text='GET ALL', command=get_all_label_entry_values)
 b1.grid(row=0, column=1, pady=2, sticky='ew', padx=2)
 
@@ -135,4 +146,10 @@ b11.grid(row=10, column=1, pady=2, sticky='ew', padx=2)
 b12 = ttk.Button(frame, text='SET STYLES', command=set_style)
 b12.grid(row=11, column=1, pady=2, sticky='ew', padx=2)
 
+b13 = ttk.Button(frame, text='SWITCH FORM TO METRIC', command=switch_all_to_metric)
+b13.grid(row=12, column=1, pady=2, sticky='ew', padx=2)
+
+b14 = ttk.Button(frame, text='SWITCH FORM TO IMPERIAL', command=switch_all_to_imperial)
+b14.grid(row=13, column=1, pady=2, sticky='ew', padx=2)
+
 root.mainloop()
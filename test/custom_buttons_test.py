@@ -51,3 +51,6 @@ for i, widget in enumerate(all_buttons):
     widget(root, language='en', style='primary', padding=1).grid(row=i, column=2, padx=10, pady=1)
 
 root.mainloop()
+
+# The icons of the destroyed root window are removed from the image cache
+print(cw.image_cache.stats())
@@ -0,0 +1,79 @@
+import tkinter as tk
+import tkinter.ttk as ttk
+from ttkbootstrap import Style
+import compoundwidgets as cw
+
+# The values of the form shall always match the 'get' method of each widget,
+# after 'set', after 'from_dict' and after a direct change of the widgets (typing on them included)
+root = tk.Tk()
+root.style = Style(theme='darkly')
+root.columnconfigure(0, weight=1)
+
+
+def check_form():
+    values = form.to_dict()
+    for key, widget in widgets.items():
+        if key not in values:
+            print(f'{key}: not on the form')
+        elif values[key] == widget.get() == form.get(key):
+            print(f'{key}: {values[key]!r} - OK')
+        else:
+            print(f'{key}: {values[key]!r} on the form, {widget.get()!r} on the widget - DIFFERENT')
+    print(f"Notes modified flag: {widgets['notes'].text.edit_modified()}")
+    print()
+
+
+def set_values():
+    for key, value in (('entry', 1.5), ('text_entry', 'abc'), ('combo', 'B'), ('spinbox', 7), ('notes', 'first')):
+        form.set(key, value)
+    form.set('length', (25.4, 'mm'))
+    check_form()
+
+
+def load_values():
+    form.from_dict({'entry': 2.5, 'text_entry': 'def', 'combo': 'C', 'spinbox': 3, 'length': (1, 'in'),
+                    'notes': 'second', 'missing': 0})
+    check_form()
+
+
+def write_variables():
+    widgets['entry'].variable.set('3.25')
+    widgets['text_entry'].variable.set('ghi')
+    widgets['combo'].variable.set('A')
+    widgets['spinbox'].variable.set('9')
+    widgets['length'].entry_variable.set('12')
+    widgets['length'].combobox_variable.set('cm')
+    widgets['notes'].text.insert('end', ' typed')
+    check_form()
+
+
+def unregister_entry():
+    form.unregister('entry')
+    check_form()
+
+
+frame = ttk.LabelFrame(root, text='Form model')
+frame.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+frame.columnconfigure(0, weight=1)
+
+widgets = {
+    'entry': cw.LabelEntry(frame, label_text='Entry', label_width=12, entry_numeric=True),
+    'text_entry': cw.LabelEntry(frame, label_text='Text entry', label_width=12),
+    'combo': cw.LabelCombo(frame, label_text='Combo', label_width=12, combo_list=('A', 'B', 'C')),
+    'spinbox': cw.LabelSpinbox(frame, label_text='Spinbox', label_width=12, entry_type='int', spin_start=0,
+                               spin_end=10),
+    'length': cw.LabelEntryUnit(frame, label_text='Length', label_width=12, combobox_unit='length'),
+    'notes': cw.LabelText(frame, label_text='Notes', label_width=12, text_height=3),
+}
+for i, widget in enumerate(widgets.values()):
+    widget.grid(row=i, column=0, sticky='nsew', pady=2)
+form = cw.FormModel(widgets)
+
+row = len(widgets)
+for text, command in (('CHECK', check_form), ('SET', set_values), ('LOAD', load_values),
+                      ('WRITE VARIABLES', write_variables), ('UNREGISTER ENTRY', unregister_entry)):
+    button = ttk.Button(frame, text=text, command=command)
+    button.grid(row=row, column=0, pady=2, sticky='ew', padx=2)
+    row += 1
+
+root.mainloop()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import tkinter as tk
+import tkinter.ttk as ttk
+from ttkbootstrap import Style
+import compoundwidgets as cw
+
+root = tk.Tk()
+root.style = Style(theme='darkly')
+root.columnconfigure(0, weight=1)
+
+saved = {}
+
+
+def save_form():
+    saved.clear()
+    saved.update(form.to_dict())
+    print(saved)
+
+
+def load_form():
+    form.from_dict(saved)
+
+
+def clear_form():
+    form.from_dict({key: '' for key in form.widgets})
+
+
+def run_sweep():
+    # Parametric sweep: each state of the form is recorded as one row of the column store
+    form.start_snapshots()
+    for i in range(1000):
+        form.from_dict({'entry_0': i, 'length': (i / 10, 'mm' if i % 2 else 'in')})
+        form.snapshot()
+    file_name = os.path.join(tempfile.gettempdir(), 'compoundwidgets_sweep.csv')
+    form.snapshots.export_csv(file_name)
+    print(f'{len(form.snapshots)} snapshots written to {file_name}')
+
+
+form = cw.FormModel()
+row = 0
+for i in range(100):
+    widget = cw.LabelEntry(root, label_text=f'Entry {i + 1}', label_width=12, entry_numeric=True,
+                           entry_value=f'{i}')
+    if i < 5:
+        widget.grid(row=row, column=0, sticky='nsew', pady=2)
+        row += 1
+    form.register(f'entry_{i}', widget)
+
+widget = cw.LabelCombo(root, label_text='Combo', label_width=12, combo_list=('A', 'B', 'C'), combo_value='A')
+widget.grid(row=row, column=0, sticky='nsew', pady=2)
+form.register('combo', widget)
+row += 1
+
+widget = cw.LabelSpinbox(root, label_text='Spinbox', label_width=12, entry_type='int', spin_start=0, spin_end=10)
+widget.grid(row=row, column=0, sticky='nsew', pady=2)
+form.register('spinbox', widget)
+row += 1
+
+widget = cw.LabelEntryUnit(root, label_text='Length', label_width=12, entry_value=25.4, combobox_unit='length')
+widget.grid(row=row, column=0, sticky='nsew', pady=2)
+form.register('length', widget)
+row += 1
+
+widget = cw.LabelText(root, label_text='Notes', label_width=12, text_height=3)
+widget.grid(row=row, column=0, sticky='nsew', pady=2)
+form.register('notes', widget)
+row += 1
+
+for text, command in (('SAVE', save_form), ('LOAD', load_form), ('CLEAR', clear_form),
+                      ('SWEEP', run_sweep)):
+    button = ttk.Button(root, text=text, command=command)
+    button.grid(row=row, column=0, sticky='nsew', pady=2)
+    row += 1
+
+root.mainloop()
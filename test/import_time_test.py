@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+# Import time benchmark, driven by 'python -X importtime'
+# Each case runs on a new interpreter. A case fails if it imports one of its forbidden modules.
+cases = (
+    ('import compoundwidgets', ('ttkbootstrap', 'PIL', 'compoundwidgets.COMPOUND_WIDGETS')),
+    ('import compoundwidgets; compoundwidgets.isfloat', ('ttkbootstrap', 'PIL')),
+    ('import compoundwidgets; compoundwidgets.LabelEntry', ('compoundwidgets.CUSTOM_BUTTONS',)),
+    ('import compoundwidgets; compoundwidgets.YesButton', ()),
+    ('import compoundwidgets; compoundwidgets.AutocompleteEntryList', ()),
+)
+
+
+def import_times(statement):
+    """
+    Runs the statement on a new interpreter.
+    Returns the cumulative import time (us) of each module and the names of the modules imported at the top level.
+    """
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+        if len(name) - len(name.lstrip()) == 1:
+            top_level.append(name.strip())
+    return times, top_level
+
+
+failures = []
+print(f'{"Statement":60s} {"Total (ms)":>12s} {"compoundwidgets (ms)":>22s}')
+for statement, forbidden in cases:
+    times, top_level = import_times(statement)
+    total = sum(times[name] for name in top_level) / 1000
+    package = sum(times[name] for name in top_level if name.startswith('compoundwidgets')) / 1000
+    print(f'{statement:60s} {total:12.1f} {package:22.1f}')
+
+    for module in forbidden:
+        if module in times:
+            failures.append(f'"{statement}" imports {module}')
+
+for failure in failures:
+    print('FAIL:', failure)
+sys.exit(1 if failures else 0)
@@ -5,7 +5,7 @@ import compoundwidgets as cw
 
 root = tk.Tk()
 
-def entry_method():
+def entry_method(event=None):
     print(f'entry method')
     all_values = []
     for w in label_entry_list:
@@ -18,14 +18,25 @@ def set_values():
         w.set(f'value {count}')
         count += 1
 
+def set_variables():
+    # Each variable is written 3 times, but each widget calls entry_method only once, after the block
+    with cw.batch_updates(root):
+        for count, w in enumerate(label_entry_list):
+            for j in range(3):
+                w.variable.set(f'var {count}.{j}')
+
 label_entry_list = []
 for i in range(10):
     w = cw.LabelEntry(root, label_text=f'Label Entry {i+1}', label_width=15, entry_method=entry_method,
-                      entry_numeric=False, entry_value='', entry_max_char=10, trace_variable=True)
+                      entry_numeric=False, entry_value='', entry_max_char=10, trace_variable=True,
+                      notify_delay_ms=200 if i % 2 else None)
     w.grid(row=i, column=0, sticky='nsew', pady=2)
     label_entry_list.append(w)
 
 button = ttk.Button(root, text='Set Values', command=set_values)
 button.grid(row=10, column=0, sticky='nsew', pady=2)
 
+button = ttk.Button(root, text='Set Variables (batch)', command=set_variables)
+button.grid(row=11, column=0, sticky='nsew', pady=2)
+
 root.mainloop()
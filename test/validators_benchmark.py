@@ -0,0 +1,41 @@
+import timeit
+import tkinter as tk
+from compoundwidgets.SCRIPTS import float_only, int_only, max_chars, get_validator, register_validator
+
+# Entry validation micro-benchmark: per call cost of the validation functions and of the shared validators
+# Each case is an entry event as Tk sends it: action (%d), new value (%P), inserted text (%S), maximum length
+cases = (
+    ('key, float', '1', '123.45', '5', '10'),
+    ('key, float, no limit', '1', '123.45', '5', 'None'),
+    ('key, rejected', '1', '123.4x', 'x', '10'),
+    ('focus', '-1', '123.45', '', '10'),
+)
+number = 200000
+
+interpreter = tk.Tcl()
+
+print(f'{"Case":24s} {"function (us)":>14s} {"validator (us)":>15s} {"Tcl function (us)":>18s} '
+      f'{"Tcl validator (us)":>19s}')
+for name, action, value, text, max_length in cases:
+    function = float_only
+    validator = get_validator('float', max_length)
+
+    function_time = timeit.timeit(lambda: function(action, value, text, max_length), number=number)
+    validator_time = timeit.timeit(lambda: validator(action, value, text), number=number)
+
+    # Same calls made by Tk: through a registered Tcl command
+    function_command = interpreter.register(function)
+    validator_command = register_validator(interpreter, validator)
+    tcl_function_time = timeit.timeit(
+        lambda: interpreter.call(function_command, action, value, text, max_length), number=number)
+    tcl_validator_time = timeit.timeit(
+        lambda: interpreter.call(validator_command, action, value, text), number=number)
+
+    print(f'{name:24s} {function_time / number * 1e6:14.3f} {validator_time / number * 1e6:15.3f} '
+          f'{tcl_function_time / number * 1e6:18.3f} {tcl_validator_time / number * 1e6:19.3f}')
+
+# Both give the same result
+for action, value, text in (('1', '12', '2'), ('1', '-', '-'), ('1', '.', '.'), ('1', '1e-05', '5'), ('0', '', '')):
+    assert float_only(action, value, text) == get_validator('float')(action, value, text)
+    assert int_only(action, value, text) == get_validator('int')(action, value, text)
+assert max_chars('1', '12345', 4) == get_validator('max_chars', 4)('1', '12345')